@@ -4,7 +4,6 @@ import logging
 import os
 import warnings
 from datetime import datetime
-from math import degrees
 from typing import Dict, List, Optional, Tuple, Union, Type
 from zipfile import ZipFile
 import pandas as pd
@@ -15,7 +14,6 @@ from ..gpx_elements import (Bounds, Copyright, Email, Extensions, Gpx, Link,
 from ..parsers.fit_parser import FitParser
 from ..parsers.gpx_parser import GPXParser
 from ..parsers.kml_parser import KMLParser
-from ..utils import EARTH_RADIUS
 from ..writers.gpx_writer import GPXWriter
 from ..writers.kml_writer import KMLWriter
 
@@ -33,7 +31,8 @@ class GPX():
             self,
             file_path: Optional[str] = None,
             xml_schema: bool = True,
-            xml_extensions_schemas: bool = False) -> None:
+            xml_extensions_schemas: bool = False,
+            simplify_tolerance: Optional[float] = None) -> None:
         """
         Initialise GPX instance.
 
@@ -45,6 +44,9 @@ class GPX():
             Toggle schema verification during parsing, by default True
         extensions_schemas : bool, optional
             Toggle extensions schema verificaton during parsing, by default False
+        simplify_tolerance : Optional[float], optional
+            Tolerance (meters) used to simplify tracks right after parsing
+            (see GPX.simplify), by default None (ie: no simplification)
         """
         # GPX file description
         self.file_path: str = None
@@ -117,6 +119,10 @@ class GPX():
                 raise ValueError(f"Unable to parse this type of file: {file_path}"
                                  "Consider renaming your file with the proper file extension.")
 
+            # Simplify large files before any other processing
+            if simplify_tolerance is not None:
+                self.simplify(simplify_tolerance)
+
             # Writers
             self._gpx_writer: GPXWriter = GPXWriter(self.gpx, self._precisions,
                                                     self._time_format)
@@ -618,8 +624,7 @@ class GPX():
             Tolerance (meters). Corresponds to the minimum distance between the
             point and the track before the point is removed, by default 2
         """
-        epsilon = degrees(tolerance/EARTH_RADIUS)
-        self.gpx.simplify(epsilon)
+        self.gpx.simplify(tolerance)
 
 ###############################################################################
 #### Merge ####################################################################
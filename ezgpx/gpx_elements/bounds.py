@@ -5,8 +5,8 @@ class Bounds(GpxElement):
     """
     boundsType element in GPX file.
     """
-    fields = ["minlat", "minlon", "maxlat", "maxlon"]
-    mandatory_fields = ["minlat", "minlon", "maxlat", "maxlon"]
+    fields = ("minlat", "minlon", "maxlat", "maxlon")
+    mandatory_fields = ("minlat", "minlon", "maxlat", "maxlon")
 
     def __init__(
             self,
@@ -5,8 +5,8 @@ class Copyright(GpxElement):
     """
     copyrightType element in GPX file.
     """
-    fields = ["author", "year", "licence"]
-    mandatory_fields = ["author"]
+    fields = ("author", "year", "licence")
+    mandatory_fields = ("author",)
 
     def __init__(
             self,
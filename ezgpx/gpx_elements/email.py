@@ -5,8 +5,8 @@ class Email(GpxElement):
     """
     emailType element in GPX file.
     """
-    fields = ["id", "domain"]
-    mandatory_fields = ["id", "domain"]
+    fields = ("id", "domain")
+    mandatory_fields = ("id", "domain")
 
     def __init__(
             self,
@@ -4,9 +4,11 @@ from .gpx_element import GpxElement
 class Extensions(GpxElement):
     """
     extensionsType element in GPX file.
+    Instances built by GPXParser may be shared by several elements with
+    identical extensions.
     """
-    fields = []
-    mandatory_fields = []
+    fields = ()
+    mandatory_fields = ()
 
     def __init__(
             self,
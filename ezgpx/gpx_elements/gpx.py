@@ -5,13 +5,18 @@ except ImportError:
 
 import logging
 from datetime import datetime, timezone
+from itertools import chain
+from operator import attrgetter
 from typing import Dict, List, Tuple, Union, Type
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import xmlschema
 
-from ..utils import haversine_distance, ramer_douglas_peucker
+from ..utils import (equirectangular_projection, haversine_distance,
+                     haversine_distance_array)
+from ..utils import _stats_numba
 from .extensions import Extensions
 from .gpx_element import GpxElement
 from .metadata import Metadata
@@ -24,9 +29,12 @@ class Gpx(GpxElement):
     """
     gpxType element in GPX file.
     """
-    fields = ["version", "creator", "metadata",
-              "wpt", "rte", "trk", "extensions"]
-    mandatory_fields = ["version", "creator"]
+    fields = ("version", "creator", "metadata",
+              "wpt", "rte", "trk", "extensions")
+    mandatory_fields = ("version", "creator")
+    NUMERICAL_VALUES = frozenset(("lat", "lon", "ele", "speed", "pace",
+                                  "ascent_rate", "ascent_speed",
+                                  "distance_from_start"))
 
     def __init__(
             self,
@@ -44,27 +52,13 @@ class Gpx(GpxElement):
         self.tag: str = tag
         self.version: str = version
         self.creator: str = creator
-        if xsi_schema_location is None:
-            self.xsi_schema_location: List[str] = []
-        else:
-            self.xsi_schema_location: List[str] = xsi_schema_location
-        if xmlns is None:
-            self.xmlns: Dict = {}
-        else:
-            self.xmlns: Dict = xmlns
+        self.xsi_schema_location: List[str] = ([] if xsi_schema_location is None
+                                               else xsi_schema_location)
+        self.xmlns: Dict = {} if xmlns is None else xmlns
         self.metadata: Metadata = metadata
-        if wpt is None:
-            self.wpt: List[WayPoint] = []
-        else:
-            self.wpt: List[WayPoint] = wpt
-        if rte is None:
-            self.rte: List[Route] = []
-        else:
-            self.rte: List[Route] = rte
-        if trk is None:
-            self.trk: List[Track] = []
-        else:
-            self.trk: List[Track] = trk
+        self.wpt: List[WayPoint] = [] if wpt is None else wpt
+        self.rte: List[Route] = [] if rte is None else rte
+        self.trk: List[Track] = [] if trk is None else trk
         self.extensions: Extensions = extensions
 
 ###############################################################################
@@ -184,6 +178,25 @@ class Gpx(GpxElement):
                 nb_pts += len(track_segment.trkpt)
         return nb_pts
 
+    def _points_array(self, name: str) -> np.ndarray:
+        """
+        Concatenate an array property of every track segment (ie: lat_array,
+        lon_array, ele_array...).
+
+        Parameters
+        ----------
+        name : str
+            Name of the TrackSegment array property.
+
+        Returns
+        -------
+        np.ndarray
+            Values of all the points in the GPX.
+        """
+        return np.concatenate([getattr(track_segment, name)
+                               for track in self.trk
+                               for track_segment in track.trkseg])
+
     def bounds(self) -> Tuple[float, float, float, float]:
         """
         Find minimum and maximum latitude and longitude.
@@ -193,6 +206,10 @@ class Gpx(GpxElement):
         Tuple[float, float, float, float]
             Min latitude, min longitude, max latitude, max longitude.
         """
+        if _stats_numba.NUMBA_AVAILABLE:
+            return _stats_numba.bounds_kernel(self._points_array("lat_array"),
+                                              self._points_array("lon_array"))
+
         min_lat = self.trk[0].trkseg[0].trkpt[0].lat
         min_lon = self.trk[0].trkseg[0].trkpt[0].lon
         max_lat = min_lat
@@ -300,15 +317,23 @@ class Gpx(GpxElement):
         """
         Compute distance from start at each point.
         """
-        dst = 0.0
-        previous_point = self.trk[0].trkseg[0].trkpt[0]
-        previous_point.distance_from_start = dst
-        for track in self.trk:
-            for track_segment in track.trkseg:
-                for track_point in track_segment.trkpt:
-                    dst += haversine_distance(previous_point, track_point)
-                    track_point.distance_from_start = dst
-                    previous_point = track_point
+        segments = [track_segment
+                    for track in self.trk
+                    for track_segment in track.trkseg]
+        lat = np.concatenate([track_segment.lat_array
+                              for track_segment in segments])
+        lon = np.concatenate([track_segment.lon_array
+                              for track_segment in segments])
+
+        # Distance between consecutive points (across segments)
+        dst = np.zeros_like(lat)
+        np.cumsum(haversine_distance_array(lat[:-1], lon[:-1], lat[1:], lon[1:]),
+                  out=dst[1:])
+
+        track_points = chain.from_iterable(
+            track_segment.trkpt for track_segment in segments)
+        for track_point, distance_from_start in zip(track_points, dst.tolist()):
+            track_point.distance_from_start = distance_from_start
 
     def ascent(self) -> float:
         """
@@ -319,6 +344,10 @@ class Gpx(GpxElement):
         float
             Ascent (meters).
         """
+        if _stats_numba.NUMBA_AVAILABLE:
+            return _stats_numba.elevation_kernel(
+                self._points_array("ele_array"))[2]
+
         ascent = 0
         previous_elevation = self.trk[0].trkseg[0].trkpt[0].ele
         for track in self.trk:
@@ -338,6 +367,10 @@ class Gpx(GpxElement):
         float
             Descent (meters).
         """
+        if _stats_numba.NUMBA_AVAILABLE:
+            return _stats_numba.elevation_kernel(
+                self._points_array("ele_array"))[3]
+
         descent = 0
         previous_elevation = self.trk[0].trkseg[0].trkpt[0].ele
         for track in self.trk:
@@ -357,6 +390,10 @@ class Gpx(GpxElement):
         float
             Minimum elevation (meters).
         """
+        if _stats_numba.NUMBA_AVAILABLE:
+            return _stats_numba.elevation_kernel(
+                self._points_array("ele_array"))[0]
+
         min_elevation = self.trk[0].trkseg[0].trkpt[0].ele
         for track in self.trk:
             for track_segment in track.trkseg:
@@ -374,6 +411,10 @@ class Gpx(GpxElement):
         float
             Maximum elevation (meters).
         """
+        if _stats_numba.NUMBA_AVAILABLE:
+            return _stats_numba.elevation_kernel(
+                self._points_array("ele_array"))[1]
+
         max_elevation = self.trk[0].trkseg[0].trkpt[0].ele
         for track in self.trk:
             for track_segment in track.trkseg:
@@ -395,9 +436,9 @@ class Gpx(GpxElement):
                     ascent = track_point.ele - previous_point.ele
                     try:
                         track_point.ascent_rate = (ascent * 100) / distance
-                        logging.debug(
-                            f"distance={distance} | ascent={ascent} | ascent_rate={track_point.ascent_rate}")
-                    except:
+                        logging.debug("distance=%s | ascent=%s | ascent_rate=%s",
+                                      distance, ascent, track_point.ascent_rate)
+                    except ZeroDivisionError:
                         track_point.ascent_rate = 0.0
                     previous_point = track_point
 
@@ -596,25 +637,38 @@ class Gpx(GpxElement):
 
         return distance / moving_time
 
+    def _time_deltas(self) -> List[float]:
+        """
+        Compute the time (seconds) elapsed since the previous track point at
+        each track point (0 for the first point).
+
+        Returns
+        -------
+        List[float]
+            Time deltas (seconds).
+        """
+        times = np.concatenate([track_segment.time_array
+                                for track in self.trk
+                                for track_segment in track.trkseg])
+        deltas = np.diff(times, prepend=times[:1]) / np.timedelta64(1, "s")
+        return deltas.tolist()
+
     def compute_points_speed(self) -> None:
         """
         Compute speed (kilometres per hour) at each track point.
         """
         previous_point = self.first_point()
-
-        for track in self.trk:
-            for track_segment in track.trkseg:
-                for track_point in track_segment.trkpt:
-                    distance = haversine_distance(
-                        previous_point, track_point) / 1000  # Convert to kilometers
-                    # Convert to hours
-                    time = (track_point.time -
-                            previous_point.time).total_seconds() / 3600
-                    try:
-                        track_point.speed = distance / time
-                    except:
-                        track_point.speed = 0.0
-                    previous_point = track_point
+        track_points = chain.from_iterable(self._segments_points())
+
+        for track_point, time in zip(track_points, self._time_deltas()):
+            distance = haversine_distance(
+                previous_point, track_point) / 1000  # Convert to kilometers
+            time = time / 3600  # Convert to hours
+            try:
+                track_point.speed = distance / time
+            except ZeroDivisionError:
+                track_point.speed = 0.0
+            previous_point = track_point
 
     def min_speed(self) -> float:
         """
@@ -689,7 +743,7 @@ class Gpx(GpxElement):
                 for point in segment.trkpt:
                     try:
                         point.pace = 60.0 / point.speed
-                    except:
+                    except ZeroDivisionError:
                         # Fill with average moving space (first point)
                         point.pace = self.avg_moving_pace()
 
@@ -738,20 +792,17 @@ class Gpx(GpxElement):
         Compute ascent speed (kilometres per hour) at each track point.
         """
         previous_point = self.first_point()
-
-        for track in self.trk:
-            for track_segment in track.trkseg:
-                for track_point in track_segment.trkpt:
-                    ascent = (track_point.ele - previous_point.ele) / \
-                        1000  # Convert to kilometers
-                    # Convert to hours
-                    time = (track_point.time -
-                            previous_point.time).total_seconds() / 3600
-                    try:
-                        track_point.ascent_speed = ascent / time
-                    except:
-                        track_point.ascent_speed = 0.0
-                    previous_point = track_point
+        track_points = chain.from_iterable(self._segments_points())
+
+        for track_point, time in zip(track_points, self._time_deltas()):
+            ascent = (track_point.ele - previous_point.ele) / \
+                1000  # Convert to kilometers
+            time = time / 3600  # Convert to hours
+            try:
+                track_point.ascent_speed = ascent / time
+            except ZeroDivisionError:
+                track_point.ascent_speed = 0.0
+            previous_point = track_point
 
     def min_ascent_speed(self) -> float:
         """
@@ -910,6 +961,9 @@ class Gpx(GpxElement):
         """
         Remove points that are to close together.
 
+        Distances are computed on a plane using the equirectangular
+        approximation (accurate for the short distances between points).
+
         Parameters
         ----------
         min_dist : float, optional
@@ -917,29 +971,51 @@ class Gpx(GpxElement):
         max_dist : float, optional
             Maximal distance between two points, by default 10
         """
+        min_dist_2 = min_dist * min_dist
+        max_dist_2 = max_dist * max_dist
+        ref_lat = self.center()[0]
+
+        def distance_2(xy_1, xy_2):
+            delta_x = xy_1[0] - xy_2[0]
+            delta_y = xy_1[1] - xy_2[1]
+            return delta_x * delta_x + delta_y * delta_y
+
         point_1 = None
         point_2 = None
+        xy_1 = None
+        xy_2 = None
 
         for track in self.trk:
             for segment in track.trkseg:
 
+                lat = np.fromiter((point.lat for point in segment.trkpt),
+                                  dtype=np.float64, count=len(segment.trkpt))
+                lon = np.fromiter((point.lon for point in segment.trkpt),
+                                  dtype=np.float64, count=len(segment.trkpt))
+                x, y = equirectangular_projection(lat, lon, ref_lat)
+
                 new_trkpt = []
 
-                for point in segment.trkpt:
+                for point, xy in zip(segment.trkpt, zip(x.tolist(), y.tolist())):
                     if point_1 is None:
                         point_1 = point
+                        xy_1 = xy
                         new_trkpt.append(point_1)
                     elif point_2 is None:
                         point_2 = point
+                        xy_2 = xy
                     else:
-                        if ((haversine_distance(point_1, point_2) < min_dist
-                             or haversine_distance(point_2, point) < min_dist)
-                                and haversine_distance(point_1, point) < max_dist):
+                        if ((distance_2(xy_1, xy_2) < min_dist_2
+                             or distance_2(xy_2, xy) < min_dist_2)
+                                and distance_2(xy_1, xy) < max_dist_2):
                             point_2 = point
+                            xy_2 = xy
                         else:
                             new_trkpt.append(point_2)
                             point_1 = point_2
+                            xy_1 = xy_2
                             point_2 = point
+                            xy_2 = xy
 
                 segment.trkpt = new_trkpt
 
@@ -947,18 +1023,18 @@ class Gpx(GpxElement):
 #### Simplification ###########################################################
 ###############################################################################
 
-    def simplify(self, epsilon):
+    def simplify(self, tolerance: float = 2):
         """
         Simplify GPX trk using Ramer-Douglas-Peucker algorithm.
 
         Parameters
         ----------
-        epsilon : _type_
-            Tolerance.
+        tolerance : float, optional
+            Tolerance (meters), by default 2
         """
         for track in self.trk:
             for segment in track.trkseg:
-                segment.trkpt = ramer_douglas_peucker(segment.trkpt, epsilon)
+                segment.simplify(tolerance)
 
 ###############################################################################
 #### Exports ##################################################################
@@ -994,6 +1070,28 @@ class Gpx(GpxElement):
         df = self.to_pandas(values)
         return df.to_dict(orient, into, index)
 
+    def _compute_values(self, values: List[str]) -> None:
+        """
+        Compute values required for an export if they are not available yet.
+
+        Parameters
+        ----------
+        values : List[str]
+            List of values to export.
+        """
+        test_point = self.first_point()
+        if "speed" in values and test_point.speed is None:
+            self.compute_points_speed()
+        if "pace" in values and test_point.pace is None:
+            self.compute_points_pace()
+        if "ascent_rate" in values and test_point.ascent_rate is None:
+            self.compute_points_ascent_rate()
+        if "ascent_speed" in values and test_point.ascent_speed is None:
+            self.compute_points_ascent_speed()
+        if ("distance_from_start" in values and
+                test_point.distance_from_start is None):
+            self.compute_points_distance_from_start()
+
     def _to_dict_df(self, values: List[str] = None) -> Dict:
         """
         Convert GPX object to dictionary.
@@ -1015,35 +1113,141 @@ class Gpx(GpxElement):
             values = ["lat", "lon"]
 
         # Compute required values
-        test_point = self.first_point()
-        if "speed" in values and test_point.speed is None:
-            self.compute_points_speed()
-        if "pace" in values and test_point.pace is None:
-            self.compute_points_pace()
-        if "ascent_rate" in values and test_point.ascent_rate is None:
-            self.compute_points_ascent_rate()
-        if "ascent_speed" in values and test_point.ascent_speed is None:
-            self.compute_points_ascent_speed()
-        if ("distance_from_start" in values and
-                test_point.distance_from_start is None):
-            self.compute_points_distance_from_start()
+        self._compute_values(values)
 
         # Create dataframe
+        segments_points = self._segments_points()
         gpx_data = {}
         for v in values:
             if v == "time":
-                gpx_data[v] = [str(trkpt.time.replace(
-                                   tzinfo=timezone.utc).astimezone(tz=None))
-                               for trk in self.trk
-                               for trkseg in trk.trkseg
-                               for trkpt in trkseg.trkpt]
+                gpx_data[v] = self._time_column(segments_points)
             else:
-                gpx_data[v] = [getattr(trkpt, v)
-                               for trk in self.trk
-                               for trkseg in trk.trkseg
-                               for trkpt in trkseg.trkpt]
+                getter = attrgetter(v)
+                gpx_data[v] = [getter(trkpt)
+                               for trkpt_list in segments_points
+                               for trkpt in trkpt_list]
         return gpx_data
 
+    def _to_records(self, values: List[str] = None) -> np.ndarray:
+        """
+        Convert GPX object to a NumPy structured array (one record per
+        track point). Numerical values are stored as floating point numbers
+        (missing values are stored as NaN).
+
+        Parameters
+        ----------
+        values : List[str], optional
+            List of values to write, by default None
+            Supported values: "lat", "lon", "ele", "time", "speed", "pace",
+            "ascent_rate", "ascent_speed", "distance_from_start"
+
+        Returns
+        -------
+        np.ndarray
+            Structured array containing data from GPX.
+        """
+        # Set default parameter
+        if values is None:
+            values = ["lat", "lon"]
+
+        # Compute required values
+        self._compute_values(values)
+
+        # Create structured array
+        dtype = np.dtype([(v, np.float64 if v in Gpx.NUMERICAL_VALUES else object)
+                          for v in values])
+        segments_points = self._segments_points()
+        nb_pts = sum(map(len, segments_points))
+        records = np.empty(nb_pts, dtype=dtype)
+        for v in values:
+            if v == "time":
+                records[v] = self._time_column(segments_points)
+            elif v in Gpx.NUMERICAL_VALUES:
+                records[v] = self._column(v, segments_points, nb_pts)
+            else:
+                getter = attrgetter(v)
+                records[v] = [getter(trkpt)
+                              for trkpt_list in segments_points
+                              for trkpt in trkpt_list]
+        return records
+
+    def _segments_points(self) -> List[List[WayPoint]]:
+        """
+        Gather the list of track points of every track segment.
+
+        Returns
+        -------
+        List[List[WayPoint]]
+            List of track points lists.
+        """
+        return [trkseg.trkpt for trk in self.trk for trkseg in trk.trkseg]
+
+    def _time_column(self, segments_points: List[List[WayPoint]]) -> List[str]:
+        """
+        Gather the time of every track point as strings (local time zone).
+
+        Parameters
+        ----------
+        segments_points : List[List[WayPoint]]
+            List of track points lists.
+
+        Returns
+        -------
+        List[str]
+            List of times.
+        """
+        utc = timezone.utc
+        return [str(trkpt.time.replace(tzinfo=utc).astimezone(tz=None))
+                for trkpt_list in segments_points
+                for trkpt in trkpt_list]
+
+    def _column(
+            self,
+            value: str,
+            segments_points: List[List[WayPoint]],
+            nb_pts: int) -> np.ndarray:
+        """
+        Gather a numerical value of every track point in an array.
+        Missing values are replaced by NaN.
+
+        Parameters
+        ----------
+        value : str
+            Name of the value.
+        segments_points : List[List[WayPoint]]
+            List of track points lists.
+        nb_pts : int
+            Number of track points.
+
+        Returns
+        -------
+        np.ndarray
+            Array containing the value of every track point.
+        """
+        getter = attrgetter(value)
+
+        # Check the first point of each segment once: if the value is
+        # available everywhere, values are read without any None check
+        if all(getter(trkpt_list[0]) is not None
+               for trkpt_list in segments_points
+               if trkpt_list):
+            try:
+                return np.fromiter(
+                    (v for trkpt_list in segments_points
+                     for v in map(getter, trkpt_list)),
+                    dtype=np.float64, count=nb_pts)
+            except TypeError:
+                pass
+
+        def get_value(point):
+            v = getter(point)
+            return np.nan if v is None else v
+
+        return np.fromiter(
+            (v for trkpt_list in segments_points
+             for v in map(get_value, trkpt_list)),
+            dtype=np.float64, count=nb_pts)
+
     def to_pandas(self, values: List[str] = None, index: bool = True) -> pd.DataFrame:
         """
         Convert GPX object to Pandas Dataframe.
@@ -1062,8 +1266,8 @@ class Gpx(GpxElement):
         pd.DataFrame
             Dataframe containing data from GPX.
         """
-        return pd.DataFrame(self._to_dict_df(values))
-    
+        return pd.DataFrame.from_records(self._to_records(values))
+
     def to_polars(self, values: List[str] = None) -> pl.DataFrame:
         """
         Convert GPX object to Polars Dataframe.
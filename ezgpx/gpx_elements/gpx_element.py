@@ -1,3 +1,4 @@
+from operator import attrgetter
 
 
 class GpxElement():
@@ -5,20 +6,33 @@ class GpxElement():
     Base class for element in GPX file.
     Implements dunders functions.
     """
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Cache a getter returning the values of the mandatory fields of the
+        subclass as a tuple.
+        """
+        super().__init_subclass__(**kwargs)
+        mandatory_fields = cls.__dict__.get("mandatory_fields")
+        if mandatory_fields is None:
+            return
+        if len(mandatory_fields) == 0:
+            cls._mandatory_fields_getter = staticmethod(lambda _: ())
+        elif len(mandatory_fields) == 1:
+            getter = attrgetter(mandatory_fields[0])
+            cls._mandatory_fields_getter = staticmethod(
+                lambda element: (getter(element),))
+        else:
+            cls._mandatory_fields_getter = staticmethod(
+                attrgetter(*mandatory_fields))
 
     def __init__(self) -> None:
         pass
 
     def __str__(self) -> str:
-        s = "("
-        for a in self.mandatory_fields:
-            s += f"{getattr(self, a)}, "
-        s = s[:-2] + ")"
-        return s
+        return "(" + ", ".join(map(str, self._mandatory_fields_getter(self))) + ")"
 
     def __repr__(self) -> str:
-        s = f"{self.__class__.__name__}[{self.tag}]("
-        for a in self.mandatory_fields:
-            s += f"{getattr(self, a)}, "
-        s = s[:-2] + ")"
-        return s
+        return (f"{self.__class__.__name__}[{self.tag}]("
+                + ", ".join(map(str, self._mandatory_fields_getter(self))) + ")")
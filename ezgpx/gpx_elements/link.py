@@ -5,8 +5,8 @@ class Link(GpxElement):
     """
     linkType element in GPX file.
     """
-    fields = ["href", "text", "type"]
-    mandatory_fields = ["href"]
+    fields = ("href", "text", "type")
+    mandatory_fields = ("href",)
 
     def __init__(
             self,
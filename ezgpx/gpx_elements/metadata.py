@@ -10,9 +10,9 @@ class Metadata(GpxElement):
     """
     metadataType element in GPX file.
     """
-    fields = ["name", "desc", "author", "copyright", "link",
-              "time", "keywords", "bounds", "extensions"]
-    mandatory_fields = []
+    fields = ("name", "desc", "author", "copyright", "link",
+              "time", "keywords", "bounds", "extensions")
+    mandatory_fields = ()
 
     def __init__(
             self,
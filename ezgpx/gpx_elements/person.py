@@ -7,8 +7,8 @@ class Person(GpxElement):
     """
     personType element in GPX file.
     """
-    fields = ["name", "email", "link"]
-    mandatory_fields = []
+    fields = ("name", "email", "link")
+    mandatory_fields = ()
 
     def __init__(
             self,
@@ -7,8 +7,9 @@ class Point(GpxElement):
     """
     ptType element in GPX file.
     """
-    fields = ["lat", "lon", "ele", "time"]
-    mandatory_fields = ["lat", "lon"]
+    fields = ("lat", "lon", "ele", "time")
+    mandatory_fields = ("lat", "lon")
+    __slots__ = ("tag", "lat", "lon", "ele", "time")
 
     def __init__(
             self,
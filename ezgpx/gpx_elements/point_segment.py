@@ -8,8 +8,8 @@ class PointSegment(GpxElement):
     """
     ptsegType element in GPX file.
     """
-    fields = ["pt"]
-    mandatory_fields = []
+    fields = ("pt",)
+    mandatory_fields = ()
 
     def __init__(
             self,
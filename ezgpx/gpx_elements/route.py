@@ -9,9 +9,9 @@ class Route(GpxElement):
     """
     rteType element in GPX file.
     """
-    fields = ["name", "cmt", "desc", "src", "link", "number", "type",
-              "extensions", "rtept"]
-    mandatory_fields = []
+    fields = ("name", "cmt", "desc", "src", "link", "number", "type",
+              "extensions", "rtept")
+    mandatory_fields = ()
 
     def __init__(
             self,
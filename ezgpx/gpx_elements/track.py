@@ -10,9 +10,11 @@ class Track(GpxElement):
     """
     trkType element in GPX file.
     """
-    fields = ["name", "cmt", "desc", "link", "number", "type",
-              "extensions", "trkseg"]
-    mandatory_fields = []
+    fields = ("name", "cmt", "desc", "link", "number", "type",
+              "extensions", "trkseg")
+    mandatory_fields = ()
+    __slots__ = ("tag", "name", "cmt", "desc", "src", "link", "number", "type",
+                 "extensions", "trkseg")
 
     def __init__(
             self,
@@ -1,5 +1,10 @@
-from typing import List
+from datetime import datetime, timezone
+from math import degrees
+from typing import Dict, List
 
+import numpy as np
+
+from ..utils import EARTH_RADIUS, ramer_douglas_peucker
 from .extensions import Extensions
 from .gpx_element import GpxElement
 from .way_point import WayPoint
@@ -9,14 +14,17 @@ class TrackSegment(GpxElement):
     """
     trksegType in GPX file.
     """
-    fields = ["trkpt", "extensions"]
-    mandatory_fields = []
+    fields = ("trkpt", "extensions")
+    mandatory_fields = ()
+    __slots__ = ("tag", "_trkpt", "extensions", "dtype", "_columns")
 
     def __init__(
             self,
             tag: str = "trkseg",
             trkpt: List[WayPoint] = None,
-            extensions: Extensions = None) -> None:
+            extensions: Extensions = None,
+            dtype: np.dtype = np.float64,
+            columns: Dict[str, np.ndarray] = None) -> None:
         """
         Initialize TrackSegment instance.
 
@@ -28,7 +36,174 @@ class TrackSegment(GpxElement):
             List of track points, by default None
         extensions : Extensions, optional
             Extensions, by default None
+        dtype : np.dtype, optional
+            Floating point type of the coordinates and elevation arrays
+            (np.float32 halves memory usage), by default np.float64
+        columns : Dict[str, np.ndarray], optional
+            Columnar storage of the track points ("lat", "lon", "ele" and
+            "time" arrays, missing values being NaN/NaT) used instead of
+            trkpt: WayPoint instances are only built when trkpt is accessed,
+            by default None
         """
         self.tag: str = tag
-        self.trkpt: List[WayPoint] = [] if trkpt is None else trkpt
+        self._columns: Dict[str, np.ndarray] = columns
+        self._trkpt: List[WayPoint] = None
+        if columns is None:
+            self._trkpt = [] if trkpt is None else trkpt
         self.extensions: Extensions = extensions
+        self.dtype: np.dtype = np.dtype(dtype)
+        if self.dtype.kind != "f":
+            raise ValueError(f"Unsupported dtype: {self.dtype}")
+
+    @property
+    def trkpt(self) -> List[WayPoint]:
+        """
+        Track points of the segment (built from the columnar storage on
+        first access, the columnar storage is then dropped).
+
+        Returns
+        -------
+        List[WayPoint]
+            Track points.
+        """
+        if self._trkpt is None:
+            columns = self._columns
+            ele = [None if e != e else e for e in columns["ele"].tolist()]
+            time = columns["time"].astype("datetime64[us]").astype(object).tolist()
+            self._trkpt = [WayPoint("trkpt", lat, lon, ele_, time_)
+                           for lat, lon, ele_, time_ in zip(
+                               columns["lat"].tolist(), columns["lon"].tolist(),
+                               ele, time)]
+            self._columns = None
+        return self._trkpt
+
+    @trkpt.setter
+    def trkpt(self, trkpt: List[WayPoint]) -> None:
+        self._trkpt = trkpt
+        self._columns = None
+
+    def append_point(
+            self,
+            lat: float,
+            lon: float,
+            ele: float = None,
+            time: datetime = None,
+            **kwargs) -> WayPoint:
+        """
+        Append a track point at the end of the segment. This allows parsers
+        to build segments incrementally (one point at a time) without
+        building an intermediate list of points.
+
+        Parameters
+        ----------
+        lat : float
+            Latitude (degrees).
+        lon : float
+            Longitude (degrees).
+        ele : float, optional
+            Elevation (meters), by default None
+        time : datetime, optional
+            Time, by default None
+        **kwargs
+            Other WayPoint fields.
+
+        Returns
+        -------
+        WayPoint
+            Appended track point.
+        """
+        track_point = WayPoint("trkpt", lat, lon, ele, time, **kwargs)
+        self.trkpt.append(track_point)
+        return track_point
+
+    def _float_array(self, value: str) -> np.ndarray:
+        """
+        Gather a numerical value of every track point in an array.
+        Missing values are replaced by NaN.
+
+        Parameters
+        ----------
+        value : str
+            Name of the value.
+
+        Returns
+        -------
+        np.ndarray
+            Array containing the value of every track point.
+        """
+        if self._columns is not None:
+            return self._columns[value].astype(self.dtype)
+        return np.fromiter(
+            (np.nan if v is None else v
+             for v in (getattr(trkpt, value) for trkpt in self.trkpt)),
+            dtype=self.dtype, count=len(self.trkpt))
+
+    @property
+    def lat_array(self) -> np.ndarray:
+        """
+        Latitude of every track point (columnar view of the segment).
+
+        Returns
+        -------
+        np.ndarray
+            Latitudes (degrees).
+        """
+        return self._float_array("lat")
+
+    @property
+    def lon_array(self) -> np.ndarray:
+        """
+        Longitude of every track point (columnar view of the segment).
+
+        Returns
+        -------
+        np.ndarray
+            Longitudes (degrees).
+        """
+        return self._float_array("lon")
+
+    @property
+    def ele_array(self) -> np.ndarray:
+        """
+        Elevation of every track point (columnar view of the segment).
+        Missing elevations are replaced by NaN.
+
+        Returns
+        -------
+        np.ndarray
+            Elevations (meters).
+        """
+        return self._float_array("ele")
+
+    @property
+    def time_array(self) -> np.ndarray:
+        """
+        Time of every track point (columnar view of the segment).
+        Time zone aware times are converted to UTC and missing times are
+        replaced by NaT.
+
+        Returns
+        -------
+        np.ndarray
+            Times (datetime64[ns]).
+        """
+        if self._columns is not None:
+            return self._columns["time"].astype("datetime64[ns]")
+        times = [None if trkpt.time is None
+                 else (trkpt.time if trkpt.time.tzinfo is None
+                       else trkpt.time.astimezone(timezone.utc).replace(tzinfo=None))
+                 for trkpt in self.trkpt]
+        return np.array(times, dtype="datetime64[ns]")
+
+    def simplify(self, epsilon_m: float = 2) -> None:
+        """
+        Simplify the segment using Ramer-Douglas-Peucker algorithm.
+
+        Parameters
+        ----------
+        epsilon_m : float, optional
+            Tolerance (meters). Corresponds to the minimum distance between the
+            point and the segment before the point is removed, by default 2
+        """
+        self.trkpt = ramer_douglas_peucker(self.trkpt,
+                                           degrees(epsilon_m / EARTH_RADIUS))
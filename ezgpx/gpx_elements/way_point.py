@@ -9,10 +9,15 @@ class WayPoint(GpxElement):
     """
     wptType element in GPX file.
     """
-    fields = ["lat", "lon", "ele", "time", "mag_var", "geo_id_height", "name",
+    fields = ("lat", "lon", "ele", "time", "mag_var", "geo_id_height", "name",
               "cmt", "desc", "src", "link", "sym", "type", "fix", "sat",
-              "hdop", "vdop", "pdop", "age_of_gps_data", "dgpsid", "extensions"]
-    mandatory_fields = ["lat", "lon"]
+              "hdop", "vdop", "pdop", "age_of_gps_data", "dgpsid", "extensions")
+    mandatory_fields = ("lat", "lon")
+    __slots__ = ("tag", "lat", "lon", "ele", "time", "mag_var", "geo_id_height",
+                 "name", "cmt", "desc", "src", "link", "sym", "type", "fix",
+                 "sat", "hdop", "vdop", "pdop", "age_of_gps_data", "dgpsid",
+                 "extensions", "speed", "pace", "ascent_rate", "ascent_speed",
+                 "distance_from_start")
 
     def __init__(
             self,
@@ -0,0 +1,190 @@
+from array import array
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from xml.parsers import expat
+    EXPAT_AVAILABLE = True
+except ImportError:
+    EXPAT_AVAILABLE = False
+
+
+def _expat_name(tag: str) -> str:
+    """
+    Convert a tag in Clark notation ("{name_space}name") to the name reported
+    by expat when namespace processing uses "}" as separator
+    ("name_space}name").
+
+    Parameters
+    ----------
+    tag : str
+        Tag (Clark notation).
+
+    Returns
+    -------
+    str
+        Name reported by expat.
+    """
+    return tag[1:] if tag.startswith("{") else tag
+
+
+def _elevation(text: Optional[str]) -> float:
+    """
+    Convert the text of an ele element to a floating point value. Missing,
+    empty or invalid elevations are replaced by NaN.
+
+    Parameters
+    ----------
+    text : Optional[str]
+        Text of the ele element.
+
+    Returns
+    -------
+    float
+        Elevation (meters).
+    """
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _times_array(times: List[Optional[str]]) -> np.ndarray:
+    """
+    Convert ISO 8601 UTC time strings to a datetime64 array. Missing or
+    invalid times are replaced by NaT.
+
+    Parameters
+    ----------
+    times : List[Optional[str]]
+        Time strings.
+
+    Returns
+    -------
+    np.ndarray
+        Times (datetime64[us]).
+    """
+    stripped = ["NaT" if time is None else time.rstrip("Z") for time in times]
+    try:
+        return np.array(stripped, dtype="datetime64[us]")
+    except ValueError:
+        pass
+
+    times_ = np.empty(len(stripped), dtype="datetime64[us]")
+    for i, time in enumerate(stripped):
+        try:
+            times_[i] = np.datetime64(time, "us")
+        except ValueError:
+            times_[i] = np.datetime64("NaT")
+    return times_
+
+
+class _PointsHandler():
+    """
+    Expat callbacks gathering the coordinates, elevation and time of track
+    points (trkpt elements at depth 3, the root element having a depth of 0).
+    """
+
+    def __init__(self, trkpt: str, ele: str, time: str) -> None:
+        """
+        Initialize _PointsHandler instance.
+
+        Parameters
+        ----------
+        trkpt : str
+            Name of trkpt elements reported by expat.
+        ele : str
+            Name of ele elements reported by expat.
+        time : str
+            Name of time elements reported by expat.
+        """
+        self.trkpt = trkpt
+        self.ele = ele
+        self.time = time
+        self.lat = array("d")
+        self.lon = array("d")
+        self.eles = array("d")
+        self.times = []
+        self.depth = -1
+        self.in_trkpt = False
+        self.point_ele = float("nan")
+        self.point_time = None
+        # Text of the current ele/time element (None outside of them)
+        self.text = None
+
+    def start_element(self, name: str, attributes: dict) -> None:
+        self.depth += 1
+        if self.in_trkpt:
+            if self.depth == 4 and (name == self.ele or name == self.time):
+                self.text = []
+        elif self.depth == 3 and name == self.trkpt:
+            self.in_trkpt = True
+            self.lat.append(float(attributes["lat"]))
+            self.lon.append(float(attributes["lon"]))
+            self.point_ele = float("nan")
+            self.point_time = None
+
+    def end_element(self, name: str) -> None:
+        self.depth -= 1
+        if not self.in_trkpt:
+            return
+        if self.text is not None:
+            if name == self.ele:
+                self.point_ele = _elevation("".join(self.text))
+            else:
+                self.point_time = "".join(self.text).strip()
+            self.text = None
+        elif self.depth == 2:
+            self.in_trkpt = False
+            self.eles.append(self.point_ele)
+            self.times.append(self.point_time)
+
+    def character_data(self, data: str) -> None:
+        if self.text is not None:
+            self.text.append(data)
+
+
+def parse_points_expat(
+        path: str,
+        trkpt: str = "{http://www.topografix.com/GPX/1/1}trkpt",
+        ele: str = "{http://www.topografix.com/GPX/1/1}ele",
+        time: str = "{http://www.topografix.com/GPX/1/1}time"
+        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read the coordinates, elevation and time of every track point of a GPX
+    file with expat callbacks, without building any element.
+
+    Parameters
+    ----------
+    path : str
+        Path to the GPX file.
+    trkpt : str, optional
+        trkpt tag (Clark notation), by default
+        "{http://www.topografix.com/GPX/1/1}trkpt"
+    ele : str, optional
+        ele tag (Clark notation), by default
+        "{http://www.topografix.com/GPX/1/1}ele"
+    time : str, optional
+        time tag (Clark notation), by default
+        "{http://www.topografix.com/GPX/1/1}time"
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        Latitudes (degrees), longitudes (degrees), elevations (meters, NaN if
+        missing) and times (datetime64[us], NaT if missing).
+    """
+    handler = _PointsHandler(_expat_name(trkpt), _expat_name(ele), _expat_name(time))
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.start_element
+    parser.EndElementHandler = handler.end_element
+    parser.CharacterDataHandler = handler.character_data
+    with open(path, "rb") as file:
+        parser.ParseFile(file)
+
+    return (np.frombuffer(handler.lat, dtype=np.float64),
+            np.frombuffer(handler.lon, dtype=np.float64),
+            np.frombuffer(handler.eles, dtype=np.float64),
+            _times_array(handler.times))
@@ -1,7 +1,6 @@
 import os
 from typing import Optional, List
 import logging
-from datetime import datetime
 
 from fitparse import FitFile
 
@@ -38,10 +37,11 @@ class FitParser(Parser):
             logging.warning("No time element in FIT file.")
             return
 
-        try:
-            datetime.strptime(time, "%Y-%m-%dT%H:%M:%S.%fZ")
+        # Both formats only differ by the fractional part of the seconds
+        # (fitparse usually returns datetime instances)
+        if isinstance(time, str) and "." in time:
             self.time_format = "%Y-%m-%dT%H:%M:%S.%fZ"
-        except:
+        else:
             self.time_format = "%Y-%m-%dT%H:%M:%SZ"  # default time format
 
     def _semicircles_to_deg(self, l: List) -> List:
@@ -71,28 +71,34 @@ class FitParser(Parser):
 
         fit_file = FitFile(self.file_path)
 
+        lat_append = lat_data.append
+        lon_append = lon_data.append
+        alt_append = alt_data.append
+        time_append = time_data.append
         for record in fit_file.get_messages("record"):
             for record_data in record:
-                if record_data.name == "position_lat":
-                    lat_data.append(record_data.value)
+                name = record_data.name
+                if name == "position_lat":
+                    lat_append(record_data.value)
                     if units["lat"] == "":
                         units["lat"] = record_data.units
                         # Temporary (may change if units["lat"] == "semicircles")
                         self.precisions["lat_lon"] = self.find_precision(
                             record_data.value)
-                if record_data.name == "position_long":
-                    lon_data.append(record_data.value)
+                elif name == "position_long":
+                    lon_append(record_data.value)
                     if units["lon"] == "":
                         units["lon"] = record_data.units
-                if record_data.name == "altitude":
-                    alt_data.append(record_data.value)
+                elif name == "altitude":
+                    alt_append(record_data.value)
                     if units["alt"] == "":
                         units["alt"] = record_data.units
                         self.precisions["elevation"] = self.find_precision(
                             record_data.value)
-                if record_data.name == "timestamp":
-                    time_data.append(record_data.value)
-                    self._set_time_format(record_data.value)
+                elif name == "timestamp":
+                    if not time_data:
+                        self._set_time_format(record_data.value)
+                    time_append(record_data.value)
 
         # Convert semicircles data to radians ??
         if units["lat"] == "semicircles":
@@ -102,10 +108,9 @@ class FitParser(Parser):
             lon_data = self._semicircles_to_deg(lon_data)
 
         # Store FIT data in Gpx element
-        trkpt = []
-        for lat, lon, alt, time in list(zip(lat_data, lon_data, alt_data, time_data)):
-            trkpt.append(WayPoint("trkpt", lat, lon, alt, time))
-        trkseg = TrackSegment(trkpt=trkpt)
+        trkseg = TrackSegment(trkpt=[
+            WayPoint("trkpt", lat, lon, alt, time)
+            for lat, lon, alt, time in zip(lat_data, lon_data, alt_data, time_data)])
         trk = Track(trkseg=[trkseg])
         self.gpx.trk = [trk]
 
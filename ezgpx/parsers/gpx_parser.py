@@ -1,25 +1,124 @@
 import os
-from typing import Optional, Union
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import logging
 from datetime import datetime
-import xml.etree.ElementTree as ET
 
-from .xml_parser import XMLParser
+import numpy as np
+
+from . import _expat_points
+from .xml_parser import (XMLParser, ET, _PARSER_OPTIONS, _fast_iso_z,
+                         _fast_iso_z_list, _ft)
 from ..gpx_elements import (Bounds, Copyright, Email, Extensions, Gpx, Link,
                             Metadata, Person, Point, PointSegment, Route,
                             TrackSegment, Track, WayPoint)
+from ..utils import _stats_numba, haversine_distance_array
+
+
+def _clear_element(element, siblings: bool = False):
+    """
+    Clear a parsed element to free memory.
+
+    Args:
+        element (xml.etree.ElementTree.Element): Parsed element.
+        siblings (bool, optional): Also remove the previous siblings of the
+            element from its parent (lxml only). Defaults to False.
+    """
+    element.clear()
+    if siblings and hasattr(element, "getprevious"):
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def _new_columns() -> Dict:
+    """
+    Create empty columns to gather track points (see
+    GPXParser._read_track_point).
+
+    Returns:
+        Dict: Empty "lat", "lon", "ele" and "time" columns.
+    """
+    return {"lat": array("d"), "lon": array("d"), "ele": array("d"), "time": []}
+
+
+def _columns_arrays(columns: Dict) -> Dict[str, np.ndarray]:
+    """
+    Convert columns gathered by GPXParser._read_track_point to NumPy arrays.
+
+    Args:
+        columns (Dict): "lat", "lon", "ele" and "time" columns.
+
+    Returns:
+        Dict[str, np.ndarray]: Latitudes (degrees), longitudes (degrees),
+            elevations (meters, NaN if missing) and times (datetime64[us],
+            NaT if missing).
+    """
+    return {"lat": np.frombuffer(columns["lat"], dtype=np.float64),
+            "lon": np.frombuffer(columns["lon"], dtype=np.float64),
+            "ele": np.frombuffer(columns["ele"], dtype=np.float64),
+            "time": _expat_points._times_array(columns["time"])}
+
+
+def _child_text(child) -> str:
+    """
+    Get the text of an element (like findtext: empty string if the element
+    has no text).
+
+    Args:
+        child (xml.etree.ElementTree.Element): Parsed element.
+
+    Returns:
+        str: Text of the element.
+    """
+    return child.text or ""
+
+
+def _child_number(child, convert: Callable) -> Union[int, float, None]:
+    """
+    Convert the text of an element to a number.
+
+    Args:
+        child (xml.etree.ElementTree.Element): Parsed element.
+        convert (Callable): Conversion function (int or float).
+
+    Returns:
+        Union[int, float, None]: Value of the element (None if the text is
+            missing or invalid).
+    """
+    try:
+        return convert(child.text)
+    except (TypeError, ValueError):
+        logging.debug("Unable to convert %s.", child)
+        return None
+
+
+def _child_float(child) -> Union[float, None]:
+    return _child_number(child, float)
+
+
+def _child_int(child) -> Union[int, None]:
+    return _child_number(child, int)
 
 
 class GPXParser(XMLParser):
     """
     GPX file parser.
     """
+    TAGS = ("ageofgpsdata", "author", "bounds", "cmt", "copyright", "desc",
+            "dgpsid", "ele", "email", "extensions", "fix", "geoidheight",
+            "hdop", "keywords", "licence", "link", "magvar", "metadata",
+            "name", "number", "pdop", "pt", "rte", "rtept", "sat", "src",
+            "sym", "text", "time", "trk", "trkpt", "trkseg", "type", "vdop",
+            "wpt", "year")
 
     def __init__(
             self,
             file_path: Optional[str] = None,
             xml_schemas: bool = True,
-            xml_extensions_schemas: bool = False) -> None:
+            xml_extensions_schemas: bool = False,
+            stats_only: bool = False,
+            columnar: bool = False,
+            extensions: bool = True) -> None:
         """
         Initialize GPXParser instance.
 
@@ -33,7 +132,20 @@ class GPXParser(XMLParser):
             Toggle extensions schema verificaton durign parsing.
             Requires internet connection and is not guaranted
             to work., by default False
-        """
+        stats_only : bool, optional
+            Only compute the statistics of the tracks (stored in the stats
+            attribute) instead of building the Gpx instance, by default False
+        columnar : bool, optional
+            Store the coordinates, elevation and time of track points in
+            arrays (see TrackSegment) instead of WayPoint instances (other
+            fields of track points are not parsed), by default False
+        extensions : bool, optional
+            Parse extensions elements (skipping them speeds up parsing of
+            files whose track points all have extensions), by default True
+        """
+        self.stats: Optional[Dict] = None
+        self._parse_extensions_enabled: bool = extensions
+
         if not file_path.endswith(".gpx"):
             return
 
@@ -41,22 +153,76 @@ class GPXParser(XMLParser):
                          xml_schemas,
                          xml_extensions_schemas)
 
+        self._way_point_dispatch: Dict[str, Tuple[str, Optional[Callable]]] = \
+            self._make_way_point_dispatch()
+        # Track point parsers indexed by the tags of the children of track
+        # points (see _parse_track_point)
+        self._track_point_extractors: Dict[Tuple[str, ...], Optional[Callable]] = {}
+
         if self.file_path is not None and os.path.exists(self.file_path):
-            self.parse()
+            if stats_only:
+                self.stats = self.parse(stats_only=True)
+            else:
+                self.parse(columnar=columnar)
         else:
             logging.warning("File path does not exist")
 
-    def _find_precisions(self):
+    def _make_way_point_dispatch(self) -> Dict[str, Tuple[str, Optional[Callable]]]:
+        """
+        Build the dispatch table of wptType children: WayPoint keyword
+        argument and conversion function (None for extensions, which also
+        need the tag of the way point) indexed by tag (Clark notation).
+
+        Returns:
+            Dict[str, Tuple[str, Optional[Callable]]]: Dispatch table.
+        """
+        fields = {"ele": ("ele", _child_float),
+                  "time": ("time", self._child_time),
+                  "magvar": ("mag_var", _child_float),
+                  "geoidheight": ("geo_id_height", _child_float),
+                  "name": ("name", _child_text),
+                  "cmt": ("cmt", _child_text),
+                  "desc": ("desc", _child_text),
+                  "src": ("src", _child_text),
+                  "link": ("link", self._parse_link),
+                  "sym": ("sym", _child_text),
+                  "type": ("type_", _child_text),
+                  "fix": ("fix", _child_text),
+                  "sat": ("sat", _child_int),
+                  "hdop": ("hdop", _child_float),
+                  "vdop": ("vdop", _child_float),
+                  "pdop": ("pdop", _child_float),
+                  "ageofgpsdata": ("age_of_gps_data", _child_float),
+                  "dgpsid": ("dgpsid", _child_float),
+                  "extensions": ("extensions", None)}
+        return {self.tags[name]: field for name, field in fields.items()}
+
+    def _child_time(self, child) -> Union[datetime, None]:
+        """
+        Convert the text of an element to a time.
+
+        Args:
+            child (xml.etree.ElementTree.Element): Parsed element.
+
+        Returns:
+            Union[datetime, None]: Value of the element (None if the text is
+                missing or invalid).
+        """
+        try:
+            return _fast_iso_z(child.text, self.time_format)
+        except (TypeError, ValueError):
+            logging.debug("Unable to convert %s.", child)
+            return None
+
+    def _find_precisions(self, point):
         """
         Find decimal precision of any type of value in a GPX file (latitude, elevation...).
         Also find if the GPX file contains elevation data.
-        """
-        # Point
-        track = self.xml_root.findall("trk", self.name_spaces)[0]
-        segment = track.findall("trkseg", self.name_spaces)[0]
-        point = segment.findall("trkpt", self.name_spaces)[0]
 
-        ele_text = point.findtext("ele", namespaces=self.name_spaces)
+        Args:
+            point (xml.etree.ElementTree.Element): First trkpt element of the file.
+        """
+        ele_text = point.findtext(self.tags["ele"])
         if ele_text is not None:
             self.ele_data = True
         else:
@@ -65,49 +231,45 @@ class GPXParser(XMLParser):
         self.precisions["lat_lon"] = self.find_precision(point.get("lat"))
         self.precisions["elevation"] = self.find_precision(ele_text)
 
-    def _find_time_element(self) -> Union[str, None]:
+    def _probe_first_point(self, point, pending: List):
         """
-        Find a time element in GPX file.
+        Find everything depending on the first track point of the file in a
+        single place: precisions and, if the metadata did not provide it,
+        time format (way points and routes waiting for the time format are
+        then parsed).
 
-        Returns:
-            Union[str, None]: Time element.
-        """
-        # Use time from metadata
-        metadata = self.xml_root.find("metadata", self.name_spaces)
-        if metadata is not None:
-            time = metadata.findtext("time", namespaces=self.name_spaces)
-            if time is not None:
-                return time
-
-        # Use time from track point
-        track = self.xml_root.findall("trk", self.name_spaces)[
-            0]  # Optimise, load only once??
-        segment = track.findall("trkseg", self.name_spaces)[0]
-        point = segment.findall("trkpt", self.name_spaces)[0]
-        time = point.findtext("time", namespaces=self.name_spaces)
-        if time is not None:
-            return time
-
-        # No time element at all...
-        return None
+        Args:
+            point (xml.etree.ElementTree.Element): First trkpt element of the file.
+            pending (List[xml.etree.ElementTree.Element]): Parsed wpt and rte
+                elements waiting for the time format.
+        """
+        self._find_precisions(point)
+        if not self._time_format_found:
+            self._find_time_format(point.findtext(self.tags["time"]))
+            self._parse_pending(pending)
 
-    def _find_time_format(self):
+    def _find_time_format(self, time: Optional[str]):
         """
-        Find the time format used in GPX file.
+        Find the time format used in GPX file (based on the time of the
+        metadata or, if there is none, of the first track point).
         Also find if the GPX file contains time data.
+
+        Args:
+            time (str, optional): Time element text.
         """
-        time = self._find_time_element()
+        self._time_format_found = True
+
         if time is None:
             self.time_data = False
             logging.warning("No time element in GPX file.")
             return
 
         self.time_data = True
-        try:
-            datetime.strptime(time, "%Y-%m-%dT%H:%M:%SZ")
-            self.time_format = "%Y-%m-%dT%H:%M:%SZ"
-        except:
+        # Both formats only differ by the fractional part of the seconds
+        if "." in time:
             self.time_format = "%Y-%m-%dT%H:%M:%S.%fZ"
+        else:
+            self.time_format = "%Y-%m-%dT%H:%M:%SZ"
 
     def _parse_bounds(self, bounds, tag: str = "bounds") -> Union[Bounds, None]:
         """
@@ -144,9 +306,11 @@ class GPXParser(XMLParser):
         if copyright_ is None:
             return None
 
+        tags = self.tags
+        findtext = copyright_.findtext
         author = copyright_.get("author")
-        year = copyright_.findtext("year", namespaces=self.name_spaces)
-        licence = copyright_.findtext("licence", namespaces=self.name_spaces)
+        year = findtext(tags["year"])
+        licence = findtext(tags["licence"])
 
         return Copyright(tag, author, year, licence)
 
@@ -174,6 +338,10 @@ class GPXParser(XMLParser):
             tag: str = "extensions") -> Union[Extensions, None]:
         """
         Parse extensionsType element from GPX file.
+        Identical extensions elements (same structure, tags, attributes and
+        texts) of a file are parsed once: they share the same Extensions
+        instance, which must therefore not be modified in place (assign a new
+        Extensions instance to the element instead).
 
         Args:
             extensions (xml.etree.ElementTree.Element): Parsed extensions element.
@@ -182,30 +350,42 @@ class GPXParser(XMLParser):
         Returns:
             Extensions: Extensions instance.
         """
-        if extensions is None:
+        if extensions is None or not self._parse_extensions_enabled:
             return None
 
         def construct_dict(e0):
-            e1s = [e1 for e1 in e0.iter()][1:]
-            if len(e1s) > 0:
-                d = {"attrib": dict(e0.items()),
-                     "elmts": {}}
-                for e1 in e1s:
-                    d["elmts"][e1.tag] = construct_dict(e1)
-                return d
+            # Build the dictionary of e0 along with the (tag, dictionary) pairs
+            # of all its descendants so that each element is visited once
+            descendants = []
+            for e1 in e0.iterfind("*"):
+                d1, descendants1 = construct_dict(e1)
+                descendants.append((e1.tag, d1))
+                descendants.extend(descendants1)
+            if len(descendants) > 0:
+                return {"attrib": dict(e0.items()),
+                        "elmts": dict(descendants)}, descendants
             else:
                 return {"attrib": {},
-                        "elmts": e0.text}
+                        "elmts": e0.text}, descendants
 
-        ext = [e for e in extensions.iter()][1]
-        values = {ext.tag: {}}
-        values[ext.tag] = construct_dict(ext)
+        ext = extensions.find("*")
+
+        # Identical extensions elements share the same Extensions instance
+        # (building the key is cheaper than building the dictionaries and the
+        # instance, eg: 939 track points of strava_run_1.gpx share 20
+        # instances)
+        key = (tag, tuple((e.tag, e.text, tuple(e.items()), len(e))
+                          for e in ext.iter("*")))
+        extensions_ = self._extensions_cache.get(key)
+        if extensions_ is None:
+            extensions_ = Extensions(tag, {ext.tag: construct_dict(ext)[0]})
+            self._extensions_cache[key] = extensions_
 
         # Etensions fields are based on the first occurance of a type encountered in the file
         if self.extensions_fields.get(element_type) is None:
-            self.extensions_fields[element_type] = values
+            self.extensions_fields[element_type] = extensions_.values
 
-        return Extensions(tag, values)
+        return extensions_
 
     def _parse_link(self, link, tag: str = "link") -> Union[Link, None]:
         """
@@ -221,9 +401,11 @@ class GPXParser(XMLParser):
         if link is None:
             return None
 
+        tags = self.tags
+        findtext = link.findtext
         href = link.get("href")
-        text = link.findtext("text", namespaces=self.name_spaces)
-        type_ = link.findtext("type", namespaces=self.name_spaces)
+        text = findtext(tags["text"])
+        type_ = findtext(tags["type"])
 
         return Link(tag, href, text, type_)
 
@@ -241,17 +423,18 @@ class GPXParser(XMLParser):
         if metadata is None:
             return None
 
-        name = metadata.findtext("name", namespaces=self.name_spaces)
-        desc = metadata.findtext("desc", namespaces=self.name_spaces)
-        author = self._parse_person(metadata.find("author", self.name_spaces))
-        copyright_ = self._parse_copyright(
-            metadata.find("copyright", self.name_spaces))
-        link = self._parse_link(metadata.find("link", self.name_spaces))
-        time = self.find_time(metadata, "time")
-        keywords = metadata.findtext("keywords", namespaces=self.name_spaces)
-        bounds = self._parse_bounds(metadata.find("bounds", self.name_spaces))
-        extensions = self._parse_extensions(
-            metadata.find("extensions", self.name_spaces), tag)
+        tags = self.tags
+        find = metadata.find
+        findtext = metadata.findtext
+        name = findtext(tags["name"])
+        desc = findtext(tags["desc"])
+        author = self._parse_person(find(tags["author"]))
+        copyright_ = self._parse_copyright(find(tags["copyright"]))
+        link = self._parse_link(find(tags["link"]))
+        time = self.find_time(metadata, tags["time"])
+        keywords = findtext(tags["keywords"])
+        bounds = self._parse_bounds(find(tags["bounds"]))
+        extensions = self._parse_extensions(find(tags["extensions"]), tag)
 
         return Metadata(tag, name, desc, author, copyright_, link, time,
                         keywords, bounds, extensions)
@@ -270,9 +453,10 @@ class GPXParser(XMLParser):
         if person is None:
             return None
 
-        name = person.findtext("name", namespaces=self.name_spaces)
-        email = self._parse_email(person.find("email", self.name_spaces))
-        link = self._parse_link(person.find("link", self.name_spaces))
+        tags = self.tags
+        name = person.findtext(tags["name"])
+        email = self._parse_email(person.find(tags["email"]))
+        link = self._parse_link(person.find(tags["link"]))
 
         return Person(tag, name, email, link)
 
@@ -295,7 +479,7 @@ class GPXParser(XMLParser):
         if point_segment is None:
             return None
 
-        pt = [self._parse_point(p) for p in point_segment.findall("pt")]
+        pt = [self._parse_point(p) for p in point_segment.findall(self.tags["pt"])]
 
         return PointSegment(tag, pt)
 
@@ -315,8 +499,8 @@ class GPXParser(XMLParser):
 
         lat = self.get_float(point, "lat")
         lon = self.get_float(point, "lon")
-        ele = self.find_float(point, "ele")
-        time = self.find_time(point, "time")  # Add namespace arg??
+        ele = self.find_float(point, self.tags["ele"])
+        time = self.find_time(point, self.tags["time"])
 
         return Point(tag, lat, lon, ele, time)
 
@@ -334,27 +518,130 @@ class GPXParser(XMLParser):
         if route is None:
             return None
 
-        name = route.findtext("name", namespaces=self.name_spaces)
-        cmt = route.findtext("cmt", namespaces=self.name_spaces)
-        desc = route.findtext("desc", namespaces=self.name_spaces)
-        src = route.findtext("src", namespaces=self.name_spaces)
-        link = self._parse_link(route.find("link", self.name_spaces))
-        number = self.find_int(route, "number")
-        type_ = route.findtext("type", namespaces=self.name_spaces)
-        extensions = self._parse_extensions(
-            route.find("extensions", self.name_spaces), tag)
-        rtept = [self._parse_way_point(way_point) for way_point in route.findall(
-            "rtept", self.name_spaces)]
+        tags = self.tags
+        findtext = route.findtext
+        name = findtext(tags["name"])
+        cmt = findtext(tags["cmt"])
+        desc = findtext(tags["desc"])
+        src = findtext(tags["src"])
+        link = self._parse_link(route.find(tags["link"]))
+        number = self.find_int(route, tags["number"])
+        type_ = findtext(tags["type"])
+        extensions = self._parse_extensions(route.find(tags["extensions"]), tag)
+        rtept = [self._parse_way_point(way_point) for way_point in route.findall(tags["rtept"])]
 
         return Route(tag, name, cmt, desc, src, link, number, type_, extensions, rtept)
 
-    def _parse_track_segment(self, track_segment, tag: str = "trkseg") -> Union[TrackSegment, None]:
+    def _make_track_point_extractor(self, shape: Tuple[str, ...]) -> Optional[Callable]:
+        """
+        Build a function parsing track points whose children have the given
+        tags (in this order). Only shapes made of ele, time and extensions
+        elements are specialized, track points of other shapes are parsed
+        using _parse_way_point.
+
+        Args:
+            shape (Tuple[str, ...]): Tags of the children (Clark notation).
+
+        Returns:
+            Optional[Callable]: Track point parser (taking the trkpt
+                element, its tag and the deferred times list), None if the
+                shape is not specialized.
+        """
+        tags = self.tags
+        positions = {}
+        for i, child_tag in enumerate(shape):
+            if (child_tag != tags["ele"] and child_tag != tags["time"]
+                    and child_tag != tags["extensions"]):
+                return None
+            # Keep the first occurrence of each tag, as find does
+            positions.setdefault(child_tag, i)
+        ele_i = positions.get(tags["ele"])
+        time_i = positions.get(tags["time"])
+        extensions_i = (positions.get(tags["extensions"])
+                        if self._parse_extensions_enabled else None)
+        parse_extensions = self._parse_extensions
+
+        def extract(track_point, tag: str, times: Optional[List]) -> WayPoint:
+            ele = None if ele_i is None else float(track_point[ele_i].text)
+            extensions = (None if extensions_i is None
+                          else parse_extensions(track_point[extensions_i], tag))
+            point = WayPoint(tag,
+                             float(track_point.get("lat")),
+                             float(track_point.get("lon")),
+                             ele, None, extensions=extensions)
+            if time_i is not None:
+                text = track_point[time_i].text
+                if times is None:
+                    point.time = _fast_iso_z(text, self.time_format)
+                elif text is not None:
+                    times.append((point, text))
+            return point
+
+        return extract
+
+    def _parse_track_point(
+            self, track_point, tag: str = "trkpt",
+            times: Optional[List] = None) -> WayPoint:
+        """
+        Parse trkpt element from GPX file.
+        Track points are parsed by a function specialized for the tags of
+        their children (see _make_track_point_extractor), built once per
+        unique shape. Track points whose shape is not specialized (or which
+        can not be parsed this way) are parsed using _parse_way_point.
+
+        Args:
+            track_point (xml.etree.ElementTree.Element): Parsed trkpt element.
+            tag (str, Optional): XML tag. Defaults to "trkpt".
+            times (List, Optional): If provided, the time of track points
+                parsed by a specialized function is not converted, the
+                track point and its time string are appended to the list
+                instead (see _set_track_point_times). Defaults to None.
+
+        Returns:
+            WayPoint: WayPoint instance.
+        """
+        shape = tuple([child.tag for child in track_point])
+        extractors = self._track_point_extractors
+        try:
+            extract = extractors[shape]
+        except KeyError:
+            extract = extractors[shape] = self._make_track_point_extractor(shape)
+        if extract is not None:
+            try:
+                return extract(track_point, tag, times)
+            except (TypeError, ValueError):
+                pass
+        return self._parse_way_point(track_point, tag)
+
+    def _set_track_point_times(self, times: List):
+        """
+        Convert the time strings deferred by _parse_track_point in bulk and
+        set the time of the track points.
+
+        Args:
+            times (List): Track points and their time string.
+        """
+        if not times:
+            return
+        points, texts = zip(*times)
+        for point, time in zip(points, _fast_iso_z_list(texts, self.time_format)):
+            point.time = time
+
+    def _parse_track_segment(
+            self, track_segment, tag: str = "trkseg",
+            trkpt: Optional[List[WayPoint]] = None,
+            columns: Optional[Dict[str, np.ndarray]] = None) -> Union[TrackSegment, None]:
         """
         Parse trksegType element from GPX file.
 
         Args:
             track_segment (xml.etree.ElementTree.Element): Parsed trkseg element.
             tag (str, Optional): XML tag. Defaults to "trkseg".
+            trkpt (List[WayPoint], Optional): Already parsed track points.
+                Defaults to None (ie: track points are parsed from the element).
+            columns (Dict[str, np.ndarray], Optional): Already parsed track
+                points in columnar storage (see TrackSegment), used instead
+                of trkpt. Defaults to None.
 
         Returns:
             TrackSegment: TrackSegment instance.
@@ -362,20 +649,28 @@ class GPXParser(XMLParser):
         if track_segment is None:
             return None
 
-        trkpt = [self._parse_way_point(track_point, "trkpt")
-                 for track_point in track_segment.findall("trkpt", self.name_spaces)]
+        if trkpt is None and columns is None:
+            times = []
+            trkpt = [self._parse_track_point(track_point, times=times)
+                     for track_point in track_segment.iterfind(self.tags["trkpt"])]
+            self._set_track_point_times(times)
         extensions = self._parse_extensions(
-            track_segment.find("extensions", self.name_spaces), tag)
+            track_segment.find(self.tags["extensions"]), tag)
 
-        return TrackSegment(tag, trkpt, extensions)
+        return TrackSegment(tag, trkpt, extensions, columns=columns)
 
-    def _parse_track(self, track, tag: str = "trk") -> Union[Track, None]:
+    def _parse_track(
+            self, track, tag: str = "trk",
+            trkseg: Optional[List[TrackSegment]] = None) -> Union[Track, None]:
         """
         Parse trkType element from GPX file.
 
         Args:
             track (xml.etree.ElementTree.Element): Parsed trk element.
             tag (str, Optional): XML tag. Defaults to "trk".
+            trkseg (List[TrackSegment], Optional): Already parsed track
+                segments. Defaults to None (ie: track segments are parsed
+                from the element).
 
         Returns:
             Track: Track instance.
@@ -383,17 +678,20 @@ class GPXParser(XMLParser):
         if track is None:
             return None
 
-        name = track.findtext("name", namespaces=self.name_spaces)
-        cmt = track.findtext("cmt", namespaces=self.name_spaces)
-        desc = track.findtext("desc", namespaces=self.name_spaces)
-        src = track.findtext("src", namespaces=self.name_spaces)
-        link = self._parse_link(track.find("link", self.name_spaces))
-        number = self.find_int(track, "number")
-        type_ = track.findtext("type", namespaces=self.name_spaces)
+        tags = self.tags
+        findtext = track.findtext
+        name = findtext(tags["name"])
+        cmt = findtext(tags["cmt"])
+        desc = findtext(tags["desc"])
+        src = findtext(tags["src"])
+        link = self._parse_link(track.find(tags["link"]))
+        number = self.find_int(track, tags["number"])
+        type_ = findtext(tags["type"])
         extensions = self._parse_extensions(
-            track.find("extensions", self.name_spaces), tag)
-        trkseg = [self._parse_track_segment(
-            segment) for segment in track.findall("trkseg", self.name_spaces)]
+            track.find(tags["extensions"]), tag)
+        if trkseg is None:
+            trkseg = list(map(self._parse_track_segment,
+                              track.iterfind(tags["trkseg"])))
 
         return Track(tag, name, cmt, desc, src, link, number, type_, extensions, trkseg)
 
@@ -411,33 +709,24 @@ class GPXParser(XMLParser):
         if way_point is None:
             return None
 
-        lat = self.get_float(way_point, "lat")
-        lon = self.get_float(way_point, "lon")
-        ele = self.find_float(way_point, "ele")
-        time = self.find_time(way_point, "time")
-        mag_var = self.find_float(way_point, "magvar")
-        geo_id_height = self.find_float(way_point, "geoidheight")
-        geo_id_height = self.find_float(way_point, "geoidheight")
-        name = way_point.findtext("name", namespaces=self.name_spaces)
-        cmt = way_point.findtext("cmt", namespaces=self.name_spaces)
-        desc = way_point.findtext("desc", namespaces=self.name_spaces)
-        src = way_point.findtext("src", namespaces=self.name_spaces)
-        link = self._parse_link(way_point.find("link", self.name_spaces))
-        sym = way_point.findtext("sym", namespaces=self.name_spaces)
-        type_ = way_point.findtext("type", namespaces=self.name_spaces)
-        fix = way_point.findtext("fix", namespaces=self.name_spaces)
-        sat = self.find_int(way_point, "sat")
-        hdop = self.find_float(way_point, "hdop")
-        vdop = self.find_float(way_point, "vdop")
-        pdop = self.find_float(way_point, "pdop")
-        age_of_gps_data = self.find_float(way_point, "ageofgpsdata")
-        dgpsid = self.find_float(way_point, "dgpsid")
-        extensions = self._parse_extensions(
-            way_point.find("extensions", self.name_spaces), tag)
+        # Single pass over the children dispatched on their tag (keeping the
+        # first occurrence of each tag, as find does)
+        dispatch = self._way_point_dispatch
+        values = {}
+        for child in way_point:
+            field = dispatch.get(child.tag)
+            if field is None or field[0] in values:
+                continue
+            name, convert = field
+            if convert is None:
+                values[name] = self._parse_extensions(child, tag)
+            else:
+                values[name] = convert(child)
 
-        return WayPoint(tag, lat, lon, ele, time, mag_var, geo_id_height, name,
-                        cmt, desc, src, link, sym, type_, fix, sat, hdop, vdop,
-                        pdop, age_of_gps_data, dgpsid, extensions)
+        return WayPoint(tag,
+                        self.get_float(way_point, "lat"),
+                        self.get_float(way_point, "lon"),
+                        **values)
 
     def _parse_root_properties(self):
         """
@@ -445,59 +734,187 @@ class GPXParser(XMLParser):
         """
         self.gpx.creator = self.xml_root.attrib["creator"]
         self.gpx.version = self.xml_root.attrib["version"]
-        schema_location = self.xml_root.get(
-            "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation").split(" ")
-        self.gpx.xsi_schema_location = [x for x in schema_location if x != ""]
+        self.gpx.xsi_schema_location = self.xml_root.get(
+            "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation", "").split()
 
-    def _parse_root_metadata(self):
+    def _parse_pending(self, pending: List):
         """
-        Parse metadataType elements from GPX file.
-        """
-        self.gpx.metadata = self._parse_metadata(
-            self.xml_root.find("metadata", self.name_spaces))
+        Parse way points and routes whose parsing was postponed until the time
+        format of the GPX file was found.
 
-    def _parse_root_way_points(self):
-        """
-        Parse wptType elements from GPX file.
+        Args:
+            pending (List[xml.etree.ElementTree.Element]): Parsed wpt and rte
+                elements.
         """
-        way_points = self.xml_root.findall("wpt", self.name_spaces)
-        for way_point in way_points:
-            self.gpx.wpt.append(self._parse_way_point(way_point))
+        for element in pending:
+            if element.tag == self.tags["wpt"]:
+                self.gpx.wpt.append(self._parse_way_point(element))
+            else:
+                self.gpx.rte.append(self._parse_route(element))
+            element.clear()
+        pending.clear()
 
-    def _parse_root_routes(self):
+    def _parse_root_extensions(self):
         """
-        Parse rteType elements from GPX file
+        Parse extensionsType elements from GPX file.
         """
-        routes = self.xml_root.findall("rte", self.name_spaces)
-        for route in routes:
-            self.gpx.rte.append(self._parse_route(route))
+        extensions = self.xml_root.find(self.tags["extensions"])
+        self.gpx.extensions = self._parse_extensions(extensions, "gpx")
 
-    def _parse_root_tracks(self):
+    def _parse_stats(self, context) -> Dict:
         """
-        Parse trkType elements from GPX file.
+        Compute the statistics of the tracks without building any GPX
+        element: only the coordinates, elevations and times of the track
+        points are kept (in arrays). Track points are read with expat
+        callbacks when available, otherwise while streaming the file.
+
+        Args:
+            context: Iterator over the remaining "start" and "end" events of
+                the file.
+
+        Returns:
+            Dict: Number of points, bounds, distance (meters), ascent
+                (meters), descent (meters), minimum and maximum elevation
+                (meters), UTC start and stop time of the tracks.
+        """
+        tags = self.tags
+        if _expat_points.EXPAT_AVAILABLE:
+            lat, lon, ele, time = _expat_points.parse_points_expat(
+                self.file_path, tags["trkpt"], tags["ele"], tags["time"])
+        else:
+            lat, lon, ele, time = self._stream_points(context)
+        ele = ele[~np.isnan(ele)]
+        time = time[~np.isnat(time)]
+
+        stats = {"nb_points": len(lat),
+                 "bounds": None,
+                 "distance": 0.0,
+                 "ascent": 0.0,
+                 "descent": 0.0,
+                 "min_elevation": None,
+                 "max_elevation": None,
+                 "utc_start_time": None,
+                 "utc_stop_time": None}
+
+        if len(lat) > 0:
+            if _stats_numba.NUMBA_AVAILABLE:
+                stats["bounds"] = _stats_numba.bounds_kernel(lat, lon)
+            else:
+                stats["bounds"] = (float(lat.min()), float(lon.min()),
+                                   float(lat.max()), float(lon.max()))
+            stats["distance"] = float(haversine_distance_array(
+                lat[:-1], lon[:-1], lat[1:], lon[1:]).sum())
+
+        if len(ele) > 0:
+            if _stats_numba.NUMBA_AVAILABLE:
+                (stats["min_elevation"], stats["max_elevation"],
+                 stats["ascent"], stats["descent"]) = _stats_numba.elevation_kernel(ele)
+            else:
+                delta = np.diff(ele)
+                stats["min_elevation"] = float(ele.min())
+                stats["max_elevation"] = float(ele.max())
+                stats["ascent"] = float(delta[delta > 0].sum())
+                stats["descent"] = float(-delta[delta < 0].sum())
+
+        if len(time) > 0:
+            stats["utc_start_time"] = time[0].astype(object)
+            stats["utc_stop_time"] = time[-1].astype(object)
+
+        logging.debug("Parsing complete!!")
+        return stats
+
+    def _read_track_point(self, track_point, columns: Dict):
         """
-        tracks = self.xml_root.findall("trk", self.name_spaces)
-        for track in tracks:
-            self.gpx.trk.append(self._parse_track(track))
+        Append the coordinates, elevation (NaN if missing or invalid) and
+        time string (None if missing) of a trkpt element to columns.
 
-    def _parse_root_extensions(self):
+        Args:
+            track_point (xml.etree.ElementTree.Element): Parsed trkpt element.
+            columns (Dict): "lat", "lon", "ele" (arrays of floats) and "time"
+                (list) columns.
         """
-        Parse extensionsType elements from GPX file.
+        columns["lat"].append(float(track_point.get("lat")))
+        columns["lon"].append(float(track_point.get("lon")))
+        columns["ele"].append(
+            _expat_points._elevation(_ft(track_point, self.tags["ele"])))
+        columns["time"].append(_ft(track_point, self.tags["time"]))
+
+    def _stream_points(self, context) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
-        extensions = self.xml_root.find("extensions", self.name_spaces)
-        self.gpx.extensions = self._parse_extensions(extensions, "gpx")
+        Read the coordinates, elevation and time of every track point while
+        streaming the GPX file (see _expat_points.parse_points_expat).
 
-    def parse(self) -> Gpx:
+        Args:
+            context: Iterator over the remaining "start" and "end" events of
+                the file.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+                Latitudes (degrees), longitudes (degrees), elevations (meters,
+                NaN if missing) and times (datetime64[us], NaT if missing).
+        """
+        trkpt_tag = self.tags["trkpt"]
+        columns = _new_columns()
+
+        depth = 1
+        for event, element in context:
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 3 and element.tag == trkpt_tag:
+                self._read_track_point(element, columns)
+                _clear_element(element, siblings=True)
+            elif 0 < depth < 3:
+                _clear_element(element, siblings=True)
+
+        columns = _columns_arrays(columns)
+        return columns["lat"], columns["lon"], columns["ele"], columns["time"]
+
+    def parse(self, stats_only: bool = False, columnar: bool = False) -> Union[Gpx, Dict]:
         """
         Parse GPX file.
+        The file is parsed in a streaming fashion: elements are converted as
+        soon as they are complete and are then cleared, so that the whole XML
+        tree is never held in memory.
+
+        Args:
+            stats_only (bool, optional): Only compute the statistics of the
+                tracks (see _parse_stats) without building any GPX element.
+                Defaults to False.
+            columnar (bool, optional): Store track points in arrays instead
+                of WayPoint instances (see TrackSegment). Defaults to False.
 
         Returns:
-            Gpx: Gpx instance.
-        """
+            Union[Gpx, Dict]: Gpx instance (statistics of the tracks if
+                stats_only is True).
+        """
+        self._extensions_cache = {}
+        self._time_format_found = False
+
+        tags = self.tags
+        trkpt_tag = tags["trkpt"]
+        trkseg_tag = tags["trkseg"]
+        trk_tag = tags["trk"]
+        wpt_tag = tags["wpt"]
+        rte_tag = tags["rte"]
+        metadata_tag = tags["metadata"]
+
+        trkpt = []
+        columns = _new_columns() if columnar else None
+        # Time strings of the track points of the current segment (converted
+        # in bulk once the segment is complete)
+        times = []
+        trkseg = []
+        # Way points and routes are parsed once the time format is known
+        pending = []
+        first_point = True
+
         # Parse GPX file
         try:
-            self.xml_tree = ET.parse(self.file_path)
-            self.xml_root = self.xml_tree.getroot()
+            context = ET.iterparse(self.file_path, events=("start", "end"),
+                                   **_PARSER_OPTIONS)
+            _, self.xml_root = next(context)
         except Exception as err:
             logging.exception("Unexpected %s, %s.\n"
                               "Unable to parse GPX file.", err, type(err))
@@ -513,39 +930,81 @@ class GPXParser(XMLParser):
         # Check XML schemas
         self.check_xml_schemas()
 
-        # Find precisions
-        self._find_precisions()
-
-        # Find time format
-        self._find_time_format()
-
-        # Parse metadata
-        try:
-            self._parse_root_metadata()
-        except:
-            logging.error("Unable to parse metadata in GPX file.")
-            raise
-
-        # Parse way points
-        try:
-            self._parse_root_way_points()
-        except:
-            logging.error("Unable to parse way_points in GPX file.")
-            raise
-
-        # Parse routes
+        if stats_only:
+            try:
+                return self._parse_stats(context)
+            except Exception as err:
+                logging.exception("Unexpected %s, %s.\n"
+                                  "Unable to parse GPX file.", err, type(err))
+                raise
+
+        # Parse elements (dispatched on their depth and tag, the root element
+        # having a depth of 0)
+        depth = 1
         try:
-            self._parse_root_routes()
-        except:
-            logging.error("Unable to parse routes in GPX file.")
+            for event, element in context:
+                if event == "start":
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 0 or depth > 3:
+                    continue
+                tag = element.tag
+                if depth == 3:
+                    if tag is not trkpt_tag:
+                        if tag != trkpt_tag:
+                            continue
+                        # Keep the tag string of the parser: xml.etree returns
+                        # the same object for every element with this tag, so
+                        # following comparisons are identity checks
+                        trkpt_tag = tag
+                    if first_point:
+                        first_point = False
+                        self._probe_first_point(element, pending)
+                    if columnar:
+                        self._read_track_point(element, columns)
+                    else:
+                        trkpt.append(self._parse_track_point(element, times=times))
+                    _clear_element(element, siblings=True)
+                elif depth == 2:
+                    if tag == trkseg_tag:
+                        if columnar:
+                            trkseg.append(self._parse_track_segment(
+                                element, columns=_columns_arrays(columns)))
+                        else:
+                            self._set_track_point_times(times)
+                            trkseg.append(self._parse_track_segment(element, trkpt=trkpt))
+                        _clear_element(element)
+                    trkpt = []
+                    columns = _new_columns() if columnar else None
+                    times = []
+                else:
+                    if tag == trk_tag:
+                        self.gpx.trk.append(
+                            self._parse_track(element, trkseg=trkseg))
+                    elif tag == metadata_tag:
+                        time = element.findtext(tags["time"])
+                        if time is not None:
+                            self._find_time_format(time)
+                        self.gpx.metadata = self._parse_metadata(element)
+                    elif tag == wpt_tag or tag == rte_tag:
+                        pending.append(element)
+                        if not self._time_format_found:
+                            continue
+                        self._parse_pending(pending)
+                    else:
+                        continue
+                    trkseg = []
+                    _clear_element(element, siblings=True)
+        except Exception as err:
+            logging.exception("Unexpected %s, %s.\n"
+                              "Unable to parse GPX file.", err, type(err))
             raise
 
-        # Parse tracks
-        try:
-            self._parse_root_tracks()
-        except:
-            logging.error("Unable to parse tracks in GPX file.")
-            raise
+        # No track point in the file
+        if not self._time_format_found:
+            self._find_time_format(None)
+        self._parse_pending(pending)
 
         # Parse extensions
         try:
@@ -553,6 +1012,9 @@ class GPXParser(XMLParser):
         except:
             logging.error("Unable to parse extensions in GPX file.")
             raise
+        self._extensions_cache.clear()
+        # The parser is kept by GPX: do not keep what is left of the XML tree
+        self.xml_root = None
 
         logging.debug("Parsing complete!!")
         return self.gpx
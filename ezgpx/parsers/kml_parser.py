@@ -1,9 +1,8 @@
 import os
 from typing import Optional, Union, List, Dict
 import logging
-import xml.etree.ElementTree as ET
 
-from .xml_parser import XMLParser
+from .xml_parser import XMLParser, ET, _PARSER_OPTIONS
 from ..gpx_elements import Gpx, TrackSegment, Track, WayPoint
 
 
@@ -11,6 +10,7 @@ class KMLParser(XMLParser):
     """
     KML file parser.
     """
+    TAGS = ("Document", "Placemark", "LineString", "coordinates", "name")
 
     def __init__(
             self,
@@ -39,12 +39,10 @@ class KMLParser(XMLParser):
         Find decimal precision of any type of value in a KML file (latitude, elevation...).
         """
         # Point
-        documents = self.xml_root.findall("opengis:Document", self.name_spaces)
-        placemarks = documents[0].findall(
-            "opengis:Placemark", self.name_spaces)
-        linestrings = placemarks[0].findall(
-            "opengis:LineString", self.name_spaces)
-        coordinates = self.find_text(linestrings[0], "opengis:coordinates")
+        documents = self.xml_root.findall(self.tags["Document"])
+        placemarks = documents[0].findall(self.tags["Placemark"])
+        linestrings = placemarks[0].findall(self.tags["LineString"])
+        coordinates = self.find_text(linestrings[0], self.tags["coordinates"])
 
         coordinates = coordinates.replace("\n", "").replace("\t", "")
         if coordinates[-1] == " ":
@@ -90,13 +88,12 @@ class KMLParser(XMLParser):
 
         placemark_data = {}
 
-        placemark_data["name"] = self.find_text(placemark, "opengis:name")
+        placemark_data["name"] = self.find_text(placemark, self.tags["name"])
 
-        placemark_data["linestrings_data"] = []
-        linestrings = placemark.findall("opengis:LineString", self.name_spaces)
-        for linestring in linestrings:
-            placemark_data["linestrings_data"].append(
-                self.find_text(linestring, "opengis:coordinates"))
+        linestrings = placemark.findall(self.tags["LineString"])
+        placemark_data["linestrings_data"] = [
+            self.find_text(linestring, self.tags["coordinates"])
+            for linestring in linestrings]
 
         return placemark_data
 
@@ -114,12 +111,10 @@ class KMLParser(XMLParser):
         if document is None:
             return None
 
-        # name = self.find_text(document, "opengis:name")
+        # name = self.find_text(document, self.tags["name"])
 
-        placemmarks_data = []
-        placemarks = document.findall("opengis:Placemark", self.name_spaces)
-        for placemark in placemarks:
-            placemmarks_data.append(self.parse_placemark(placemark))
+        placemarks = document.findall(self.tags["Placemark"])
+        placemmarks_data = list(map(self.parse_placemark, placemarks))
 
         return placemmarks_data
 
@@ -127,7 +122,7 @@ class KMLParser(XMLParser):
         """
         Parse Document elements from KML file.
         """
-        documents = self.xml_root.findall("opengis:Document", self.name_spaces)
+        documents = self.xml_root.findall(self.tags["Document"])
         for document in documents:
             placemarks_data = self.parse_document(document)
 
@@ -136,13 +131,9 @@ class KMLParser(XMLParser):
                 linestrings_data = placemark_data["linestrings_data"]
                 trkseg = []
                 for coordinates in linestrings_data:
-                    coordinates = coordinates.replace(
-                        "\n", "").replace("\t", "")
-                    if coordinates[-1] == " ":
-                        coordinates = coordinates[:-1]
-                    coordinates = coordinates.split(" ")
                     trkpt = []
-                    for point_coord in coordinates:
+                    # "lon,lat,ele" tuples separated by whitespaces
+                    for point_coord in coordinates.split():
                         point_coord = point_coord.split(",")
                         trkpt.append(WayPoint(tag="trkpt",
                                               lat=float(point_coord[1]),
@@ -172,7 +163,8 @@ class KMLParser(XMLParser):
         """
         # Parse KML file
         try:
-            self.xml_tree = ET.parse(self.file_path)
+            self.xml_tree = ET.parse(self.file_path,
+                                     ET.XMLParser(**_PARSER_OPTIONS))
             self.xml_root = self.xml_tree.getroot()
         except Exception as err:
             logging.exception("Unexpected %s, %s.\n"
@@ -195,5 +187,9 @@ class KMLParser(XMLParser):
             logging.error("Unable to parse tracks in GPX file.")
             raise
 
+        # The parser is kept by GPX: free the XML tree
+        self.xml_tree = None
+        self.xml_root = None
+
         logging.debug("Parsing complete!!")
         return self.gpx
@@ -63,19 +63,10 @@ class Parser():
         elif isinstance(number, str):
             try:
                 float(number)
-            except OSError as err:
-                logging.exception("OS error: %s", err)
             except ValueError:
                 logging.exception("Could not convert data (%s) to a floating"
                                   "point value.", number)
-            except Exception as err:
-                logging.exception("Unexpected %s, %s."
-                                  "Unable to find precision of number: %s",
-                                  err, type(err), number)
-                raise
+                return DEFAULT_PRECISION
 
-        if "." in number:
-            _, decimal = number.split(sep=".")
-            return len(decimal)
-        else:
-            return 0
+        i = number.rfind(".")
+        return len(number) - i - 1 if i >= 0 else 0
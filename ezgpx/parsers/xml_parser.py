@@ -1,16 +1,160 @@
+import os
 import warnings
-from typing import Dict, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import logging
 from datetime import datetime
-import xml.etree.ElementTree as ET
+
+import numpy as np
+
+# Use lxml when available (faster parsing), unless the standard library
+# implementation is explicitly requested with EZGPX_FORCE_STDLIB_ET=1
+# (lxml is not always faster on recent Python versions).
+if os.environ.get("EZGPX_FORCE_STDLIB_ET", "0") not in ("", "0"):
+    import xml.etree.ElementTree as ET
+else:
+    try:
+        from lxml import etree as ET
+    except ImportError:
+        import xml.etree.ElementTree as ET
+
+# Options of lxml parsers: do not limit the size of the file (text nodes,
+# tree depth), do not collect XML ids (never used when parsing GPX files) and
+# drop the ignorable whitespace between elements (indentation)
+_PARSER_OPTIONS = ({"huge_tree": True, "collect_ids": False, "remove_blank_text": True}
+                   if ET.__name__ == "lxml.etree" else {})
 
 from .parser import Parser
 
 
+@lru_cache(maxsize=None)
+def _clark_tags(name_space: Optional[str], names: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Build the Clark notation ("{name_space}name") of XML tags so that elements
+    can be found without resolving namespace prefixes on each lookup.
+
+    Parameters
+    ----------
+    name_space : Optional[str]
+        Default namespace of the XML file (None if there is no namespace).
+    names : Tuple[str, ...]
+        Local names of the tags.
+
+    Returns
+    -------
+    Dict[str, str]
+        Clark notation of the tags indexed by local name.
+    """
+    prefix = "" if name_space is None else "{" + name_space + "}"
+    return {name: prefix + name for name in names}
+
+
+def _fast_iso_z(text: str, time_format: str) -> datetime:
+    """
+    Convert an ISO 8601 UTC time string ("YYYY-MM-DDThh:mm:ssZ" or
+    "YYYY-MM-DDThh:mm:ss.fffZ") to datetime by slicing it, which is much
+    faster than datetime.strptime. Other strings and formats are converted
+    using datetime.strptime.
+
+    Parameters
+    ----------
+    text : str
+        Time string.
+    time_format : str
+        Time format used in the file.
+
+    Returns
+    -------
+    datetime
+        Time.
+    """
+    if (len(text) >= 20 and text[-1] == "Z" and text[4] == "-"
+            and text[7] == "-" and text[10] == "T" and text[13] == ":"
+            and text[16] == ":"):
+        if len(text) == 20:
+            if time_format == "%Y-%m-%dT%H:%M:%SZ":
+                return datetime(int(text[0:4]), int(text[5:7]),
+                                int(text[8:10]), int(text[11:13]),
+                                int(text[14:16]), int(text[17:19]))
+        elif (text[19] == "." and 21 < len(text) <= 27
+              and time_format == "%Y-%m-%dT%H:%M:%S.%fZ"):
+            return datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]),
+                            int(text[11:13]), int(text[14:16]),
+                            int(text[17:19]), int(text[20:-1].ljust(6, "0")))
+    return datetime.strptime(text, time_format)
+
+
+def _fast_iso_z_list(texts: Sequence[str], time_format: str) -> List[Optional[datetime]]:
+    """
+    Convert ISO 8601 UTC time strings to datetime in bulk using NumPy
+    datetime64 parsing. Strings are converted one by one using _fast_iso_z
+    if they are not all in the format used in the file, strings that can not
+    be converted are replaced by None.
+
+    Parameters
+    ----------
+    texts : Sequence[str]
+        Time strings.
+    time_format : str
+        Time format used in the file.
+
+    Returns
+    -------
+    List[Optional[datetime]]
+        Times.
+    """
+    if time_format == "%Y-%m-%dT%H:%M:%SZ":
+        stripped = [text[:-1] for text in texts
+                    if len(text) == 20 and text[-1] == "Z" and text[10] == "T"]
+    elif time_format == "%Y-%m-%dT%H:%M:%S.%fZ":
+        stripped = [text[:-1] for text in texts
+                    if 21 < len(text) <= 27 and text[-1] == "Z"
+                    and text[10] == "T" and text[19] == "."]
+    else:
+        stripped = []
+    if len(stripped) == len(texts):
+        try:
+            return np.array(stripped, dtype="datetime64[us]").astype(object).tolist()
+        except ValueError:
+            pass
+
+    times = []
+    for text in texts:
+        try:
+            times.append(_fast_iso_z(text, time_format))
+        except ValueError:
+            logging.debug("Unable to convert %s to datetime.", text)
+            times.append(None)
+    return times
+
+
+def _ft(element, tag: str) -> Union[str, None]:
+    """
+    Find text from the first sub-element matching a tag, without namespace
+    map nor exception handling.
+
+    Parameters
+    ----------
+    element : xml.etree.ElementTree.Element
+        Parsed element.
+    tag : str
+        Sub-element tag (Clark notation).
+
+    Returns
+    -------
+    Union[str, None]
+        Text from sub-element (None if there is no such sub-element).
+    """
+    child = element.find(tag)
+    return child.text if child is not None else None
+
+
 class XMLParser(Parser):
     """
     XML File parser.
     """
+    # Local names of the tags found by the parser
+    TAGS: Tuple[str, ...] = ()
 
     def __init__(
             self,
@@ -32,8 +176,10 @@ class XMLParser(Parser):
             by default False
         """
         self.name_spaces: dict = dict(
-            [node for _, node in ET.iterparse(file_path, events=["start-ns"])])
+            [node for _, node in ET.iterparse(file_path, events=("start-ns",), **_PARSER_OPTIONS)])
         self.extensions_fields: Dict = {}
+        self.tags: Dict[str, str] = _clark_tags(
+            self.name_spaces.get(""), self.TAGS)
 
         super().__init__(file_path, self.name_spaces)
 
@@ -56,7 +202,7 @@ class XMLParser(Parser):
         """
         try:
             text_ = element.get(sub_element)
-        except:
+        except AttributeError:
             logging.debug("%s has no attribute %s.", element, sub_element)
             text_ = None
         return text_
@@ -72,12 +218,14 @@ class XMLParser(Parser):
         Returns:
             Union[int, None]: Integer value from sub-element.
         """
-        try:
-            int_ = int(element.get(sub_element))
-        except:
-            logging.debug(f"{element} has no attribute {sub_element}.")
-            int_ = None
-        return int_
+        text_ = element.get(sub_element)
+        if text_ is not None:
+            try:
+                return int(text_)
+            except ValueError:
+                pass
+        logging.debug("%s has no attribute %s.", element, sub_element)
+        return None
 
     def get_float(self, element, sub_element: str) -> Union[float, None]:
         """
@@ -90,12 +238,14 @@ class XMLParser(Parser):
         Returns:
             Union[float, None]: Floating point value from sub-element.
         """
-        try:
-            float_ = float(element.get(sub_element))
-        except:
-            logging.debug(f"{element} has no attribute {sub_element}.")
-            float_ = None
-        return float_
+        text_ = element.get(sub_element)
+        if text_ is not None:
+            try:
+                return float(text_)
+            except ValueError:
+                pass
+        logging.debug("%s has no attribute %s.", element, sub_element)
+        return None
 
     def find_text(self, element, sub_element: str) -> Union[str, None]:
         """
@@ -103,16 +253,14 @@ class XMLParser(Parser):
 
         Args:
             element (xml.etree.ElementTree.Element): Parsed element from GPX file.
-            sub_element (str): Sub-element name.
+            sub_element (str): Sub-element tag (Clark notation).
 
         Returns:
             Union[str, None]: Text from sub-element.
         """
-        try:
-            text_ = element.find(sub_element, self.name_spaces).text
-        except:
-            text_ = None
-            logging.debug(f"{element} has no attribute {sub_element}.")
+        text_ = _ft(element, sub_element)
+        if text_ is None:
+            logging.debug("%s has no attribute %s.", element, sub_element)
         return text_
 
     def find_int(self, element, sub_element: str) -> Union[int, None]:
@@ -121,17 +269,19 @@ class XMLParser(Parser):
 
         Args:
             element (xml.etree.ElementTree.Element): Parsed element from GPX file.
-            sub_element (str): Sub-element name.
+            sub_element (str): Sub-element tag (Clark notation).
 
         Returns:
             Union[int, None]: Integer value from sub-element.
         """
-        try:
-            int_ = int(element.find(sub_element, self.name_spaces).text)
-        except:
-            int_ = None
-            logging.debug(f"{element} has no attribute {sub_element}.")
-        return int_
+        text_ = _ft(element, sub_element)
+        if text_ is not None:
+            try:
+                return int(text_)
+            except ValueError:
+                pass
+        logging.debug("%s has no attribute %s.", element, sub_element)
+        return None
 
     def find_float(self, element, sub_element: str) -> Union[float, None]:
         """
@@ -139,17 +289,19 @@ class XMLParser(Parser):
 
         Args:
             element (xml.etree.ElementTree.Element): Parsed element from GPX file.
-            sub_element (str): Sub-element name.
+            sub_element (str): Sub-element tag (Clark notation).
 
         Returns:
             Union[float, None]: Floating point value from sub-element.
         """
-        try:
-            float_ = float(element.find(sub_element, self.name_spaces).text)
-        except:
-            float_ = None
-            logging.debug(f"{element} has no attribute {sub_element}.")
-        return float_
+        text_ = _ft(element, sub_element)
+        if text_ is not None:
+            try:
+                return float(text_)
+            except ValueError:
+                pass
+        logging.debug("%s has no attribute %s.", element, sub_element)
+        return None
 
     def find_time(self, element, sub_element: str) -> Union[datetime, None]:
         """
@@ -157,18 +309,19 @@ class XMLParser(Parser):
 
         Args:
             element (xml.etree.ElementTree.Element): Parsed element from GPX file.
-            sub_element (str): Sub-element name.
+            sub_element (str): Sub-element tag (Clark notation).
 
         Returns:
             Union[datetime, None]: Floating point value from sub-element.
         """
-        try:
-            time_ = datetime.strptime(element.find(
-                sub_element, self.name_spaces).text, self.time_format)
-        except:
-            time_ = None
-            logging.debug(f"{element} has no attribute {sub_element}.")
-        return time_
+        text_ = _ft(element, sub_element)
+        if text_ is not None:
+            try:
+                return _fast_iso_z(text_, self.time_format)
+            except ValueError:
+                pass
+        logging.debug("%s has no attribute %s.", element, sub_element)
+        return None
 
     def check_xml_schemas(self):
         """
@@ -1,2 +1,2 @@
 from .algorithms import *
-from .distance import *
\ No newline at end of file
+from .distance import *
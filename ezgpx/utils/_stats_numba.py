@@ -0,0 +1,77 @@
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def bounds_kernel(
+        lat: np.ndarray,
+        lon: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Find minimum and maximum latitude and longitude in a single loop.
+
+    Parameters
+    ----------
+    lat : np.ndarray
+        Latitudes (degrees).
+    lon : np.ndarray
+        Longitudes (degrees).
+
+    Returns
+    -------
+    Tuple[float, float, float, float]
+        Min latitude, min longitude, max latitude, max longitude.
+    """
+    min_lat = max_lat = lat[0]
+    min_lon = max_lon = lon[0]
+    for i in range(1, lat.shape[0]):
+        if lat[i] < min_lat:
+            min_lat = lat[i]
+        if lon[i] < min_lon:
+            min_lon = lon[i]
+        if lat[i] > max_lat:
+            max_lat = lat[i]
+        if lon[i] > max_lon:
+            max_lon = lon[i]
+    return min_lat, min_lon, max_lat, max_lon
+
+def elevation_kernel(ele: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Compute minimum elevation, maximum elevation, ascent and descent in a
+    single loop (sums are accumulated in order so that results match the
+    pure Python implementation).
+
+    Parameters
+    ----------
+    ele : np.ndarray
+        Elevations (meters).
+
+    Returns
+    -------
+    Tuple[float, float, float, float]
+        Min elevation, max elevation, ascent, descent (meters).
+    """
+    min_ele = max_ele = previous_ele = ele[0]
+    ascent = 0.0
+    descent = 0.0
+    for i in range(1, ele.shape[0]):
+        if ele[i] < min_ele:
+            min_ele = ele[i]
+        if ele[i] > max_ele:
+            max_ele = ele[i]
+        if ele[i] > previous_ele:
+            ascent += ele[i] - previous_ele
+        elif ele[i] < previous_ele:
+            descent += previous_ele - ele[i]
+        previous_ele = ele[i]
+    return min_ele, max_ele, ascent, descent
+
+
+if NUMBA_AVAILABLE:
+    bounds_kernel = njit(cache=True)(bounds_kernel)
+    elevation_kernel = njit(cache=True)(elevation_kernel)
@@ -1,7 +1,9 @@
 from typing import List
-from math import degrees
+from math import degrees, radians
 
-from .distance import EARTH_RADIUS, perpendicular_distance
+import numpy as np
+
+from .distance import EARTH_RADIUS, equirectangular_projection
 
 
 def ramer_douglas_peucker(points: List, epsilon: float = degrees(2/EARTH_RADIUS)):
@@ -9,6 +11,9 @@ def ramer_douglas_peucker(points: List, epsilon: float = degrees(2/EARTH_RADIUS)
     Simplify a curve using the Ramer-Douglas-Peucker algorithm.
     Source: https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm
 
+    Points are projected once using the equirectangular approximation so that
+    distances to the lines are computed on a plane (meters).
+
     Parameters
     ----------
     points : List
@@ -24,32 +29,47 @@ def ramer_douglas_peucker(points: List, epsilon: float = degrees(2/EARTH_RADIUS)
     List
         List of points defining the simplified track.
     """
-    # Find the point with the maximum distance
-    d_max = 0
-    i_max = 0
+    if len(points) < 3:
+        return list(points)
 
-    start_point = points[0]
-    end_point = points[len(points)-1]
+    lat = np.fromiter((point.lat for point in points),
+                      dtype=np.float64, count=len(points))
+    lon = np.fromiter((point.lon for point in points),
+                      dtype=np.float64, count=len(points))
+    x, y = equirectangular_projection(lat, lon)
 
-    for i in range(1, len(points)-1):
-        d = perpendicular_distance(start_point, end_point, points[i])
-        if d > d_max:
-            d_max = d
-            i_max = i
+    # Compare squared distances (meters)
+    epsilon = radians(epsilon) * EARTH_RADIUS
+    epsilon_2 = epsilon * epsilon
 
-    # logging.info(f"i_max = {i_max} | d_max = {d_max}")
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
 
-    result = []
+    # Use an explicit stack instead of recursive calls
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
 
-    # If max distance is greater than epsilon, recursively simplify
-    if d_max > epsilon:
-        # Recursive call
-        result_1 = ramer_douglas_peucker(points[0:i_max+1], epsilon)
-        result_2 = ramer_douglas_peucker(points[i_max:len(points)], epsilon)
+        # Find the point with the maximum distance
+        delta_x = x[end] - x[start]
+        delta_y = y[end] - y[start]
+        inner_x = x[start+1:end] - x[start]
+        inner_y = y[start+1:end] - y[start]
+        length_2 = delta_x * delta_x + delta_y * delta_y
+        if length_2 > 0.0:
+            cross = delta_x * inner_y - delta_y * inner_x
+            d_2 = cross * cross / length_2
+        else:
+            d_2 = inner_x * inner_x + inner_y * inner_y
+        i_max = int(np.argmax(d_2))
 
-        # Build result list
-        result = result_1 + result_2[1:]
-    else:
-        result = [start_point, end_point]
+        # If max distance is greater than epsilon, simplify both halves
+        if d_2[i_max] > epsilon_2:
+            i_max += start + 1
+            keep[i_max] = True
+            stack.append((i_max, end))
+            stack.append((start, i_max))
 
-    return result
+    return [point for point, kept in zip(points, keep.tolist()) if kept]
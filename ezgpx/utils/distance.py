@@ -1,5 +1,8 @@
 import math as m
 import logging
+from typing import Optional, Tuple
+
+import numpy as np
 
 # latitude/longitude in GPX files is always in WGS84 datum
 # WGS84 defined the Earth semi-major axis with 6378.137 km
@@ -37,6 +40,79 @@ def haversine_distance(point_1, point_2) -> float:
     return d
 
 
+def haversine_distance_array(
+        lat_1: np.ndarray,
+        lon_1: np.ndarray,
+        lat_2: np.ndarray,
+        lon_2: np.ndarray) -> np.ndarray:
+    """
+    Compute Haversine distances (meters) between pairs of points
+    (element-wise version of haversine_distance).
+    Source: https://en.wikipedia.org/wiki/Haversine_formula
+
+    Parameters
+    ----------
+    lat_1 : np.ndarray
+        Latitudes (degrees) of the first points.
+    lon_1 : np.ndarray
+        Longitudes (degrees) of the first points.
+    lat_2 : np.ndarray
+        Latitudes (degrees) of the second points.
+    lon_2 : np.ndarray
+        Longitudes (degrees) of the second points.
+
+    Returns
+    -------
+    np.ndarray
+        Haversine distances between the points.
+    """
+    lat_1 = np.asarray(lat_1, dtype=np.float64)
+    lon_1 = np.asarray(lon_1, dtype=np.float64)
+    lat_2 = np.asarray(lat_2, dtype=np.float64)
+    lon_2 = np.asarray(lon_2, dtype=np.float64)
+
+    # Delta and conversion to radians
+    sin_1 = np.sin(np.radians(lat_1 - lat_2) / 2)
+    sin_2 = np.sin(np.radians(lon_1 - lon_2) / 2)
+    a = np.sqrt(sin_1 * sin_1 + np.cos(np.radians(lat_1))
+                * np.cos(np.radians(lat_2)) * sin_2 * sin_2)
+    return 2 * EARTH_RADIUS * np.arcsin(a)
+
+
+def equirectangular_projection(
+        lat: np.ndarray,
+        lon: np.ndarray,
+        ref_lat: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project coordinates on a plane using the equirectangular approximation.
+    Distances between projected points are accurate enough for the short
+    distances found between consecutive points of a track.
+    Source: https://en.wikipedia.org/wiki/Equirectangular_projection
+
+    Parameters
+    ----------
+    lat : np.ndarray
+        Latitudes (degrees).
+    lon : np.ndarray
+        Longitudes (degrees).
+    ref_lat : Optional[float], optional
+        Reference latitude (degrees), by default None (ie: mean latitude).
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Projected coordinates (meters).
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    if ref_lat is None:
+        ref_lat = lat.mean() if lat.size > 0 else 0.0
+    meters_per_degree = m.radians(EARTH_RADIUS)
+    x = lon * (m.cos(m.radians(ref_lat)) * meters_per_degree)
+    y = lat * meters_per_degree
+    return x, y
+
+
 def distance(point_1, point_2) -> float:
     """
     Euclidian distance between two points.
@@ -101,7 +177,7 @@ def perpendicular_distance(start_point, end_point, point) -> float:
             a = delta_y / delta_x
             b = -1
             c = point_1.lat - a * point_1.lon
-        except:
+        except ZeroDivisionError:
             a = 1
             b = 0
             c = point_1.lon
@@ -1,16 +1,17 @@
 import os
+import copy
 import errno
 import warnings
-from typing import List, Dict
+from typing import Dict, Iterator, List
 import logging
-import xml.etree.ElementTree as ET
 
-from .writer import Writer
+from .writer import Writer, ET, LXML, SubElement
 from ..gpx_elements import (Bounds, Copyright, Email, Extensions, Gpx, Link,
                             Metadata, Person, PointSegment, Point, Route,
                             TrackSegment, Track, WayPoint)
 from .gpx_writer_method_behavior_creator import GPXWriterMethodBehaviorCreator
 
+XSI_SCHEMA_LOCATION = "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation"
 
 class GPXWriter(Writer):
     """
@@ -36,6 +37,12 @@ class GPXWriter(Writer):
         self.precisions: Dict = precisions
         self.time_format: str = time_format
 
+        # Precisions used for each point (see write)
+        self._precision_lat_lon: int = None
+        self._precision_elevation: int = None
+        self._precision_default: int = None
+        self._lat_lon_format_spec: str = None
+
         # Utility attributes
         self.file_name: str = ""
         self.gpx_string: str = ""
@@ -81,46 +88,37 @@ class GPXWriter(Writer):
         print(element, subelement)
         return None
 
-    def add_bounds(self, element: ET.Element, bounds: Bounds) -> ET.Element:
+    def add_bounds(self, element: ET.Element, bounds: Bounds) -> None:
         """
         Add Bounds instance to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             bounds (Bounds): Bounds instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_bounds(self, element, bounds)
+        self._add_bounds(self, element, bounds)
 
-    def add_copyright(self, element: ET.Element, copyright_: Copyright) -> ET.Element:
+    def add_copyright(self, element: ET.Element, copyright_: Copyright) -> None:
         """
         Add Copyright instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             copyright (Copyright): Copyright instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_copyright(self, element, copyright_)
+        self._add_copyright(self, element, copyright_)
 
-    def add_email(self, element: ET.Element, email: Email) -> ET.Element:
+    def add_email(self, element: ET.Element, email: Email) -> None:
         """
         Add Email instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             email (Email): Email instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_email(self, element, email)
+        self._add_email(self, element, email)
 
-    def _add_extensions_rec(self, extensions_, values, extensions_fields) -> ET.Element:
+    def _add_extensions_rec(self, extensions_, values, extensions_fields) -> None:
         if extensions_ is not None:
             # Add n-th level extensions
             for k0, v0 in values.items():
@@ -128,7 +126,7 @@ class GPXWriter(Writer):
                     # If k0 contains sub-elements
                     if isinstance(v0["elmts"], dict):
                         # Create sub-element
-                        sub_extensions_ = ET.SubElement(extensions_, k0)
+                        sub_extensions_ = SubElement(extensions_, k0)
 
                         # Set attributes
                         for k1, v1 in v0["attrib"].items():
@@ -136,11 +134,11 @@ class GPXWriter(Writer):
                                 self.setIfNotNone(extensions_, k1, v1)
 
                         # Add (n+1)-th level extensions
-                        sub_extensions_ = self._add_extensions_rec(
+                        self._add_extensions_rec(
                             sub_extensions_, v0["elmts"], extensions_fields[k0]["elmts"])
                     # Else, k0 contains a value
                     else:
-                        extensions_, sub_extensions_ = self.add_subelement(
+                        sub_extensions_ = self.add_subelement(
                             extensions_, k0, v0["elmts"])
 
                         # Set attributes
@@ -148,11 +146,9 @@ class GPXWriter(Writer):
                             if k1 in extensions_fields[k0]["attrib"].keys():
                                 self.setIfNotNone(sub_extensions_, k1, v1)
 
-        return extensions_
-
     def add_extensions(
             self, element: ET.Element, extensions: Extensions,
-            extensions_fields: Dict) -> ET.Element:
+            extensions_fields: Dict) -> None:
         """
         Add Extnsions instance element to GPX element.
 
@@ -164,147 +160,111 @@ class GPXWriter(Writer):
             Extensions instance to add
         extensions_fields : Dict
             Extensions fileds to add
-
-        Returns
-        -------
-        xml.etree.ElementTree.Element
-            GPX element
         """
         if extensions is not None:
-            extensions_ = ET.SubElement(element, extensions.tag)
-            extensions_ = self._add_extensions_rec(
+            extensions_ = SubElement(element, extensions.tag)
+            self._add_extensions_rec(
                 extensions_, extensions.values, extensions_fields)
-        return element
 
-    def add_link(self, element: ET.Element, link: Link) -> ET.Element:
+    def add_link(self, element: ET.Element, link: Link) -> None:
         """
         Add Link instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             link (Link): Link instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_link(self, element, link)
+        self._add_link(self, element, link)
 
-    def add_metadata(self, element: ET.Element, metadata: Metadata) -> ET.Element:
+    def add_metadata(self, element: ET.Element, metadata: Metadata) -> None:
         """
         Add Metadata instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             metadata (Metadata): Metadata instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_metadata(self, element, metadata)
+        self._add_metadata(self, element, metadata)
 
-    def add_person(self, element: ET.Element, person: Person) -> ET.Element:
+    def add_person(self, element: ET.Element, person: Person) -> None:
         """
         Add Person instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             person (Person): Person instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_person(self, element, person)
+        self._add_person(self, element, person)
 
-    def add_point_segment(self, element: ET.Element, point_segment: PointSegment) -> ET.Element:
+    def add_point_segment(self, element: ET.Element, point_segment: PointSegment) -> None:
         """
         Add PointSegment instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             point_segment (PointSegment): PointSegment instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_point_segment(self, element, point_segment)
+        self._add_point_segment(self, element, point_segment)
 
-    def add_point(self, element: ET.Element, point: Point) -> ET.Element:
+    def add_point(self, element: ET.Element, point: Point) -> None:
         """
         Add Point instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             point (Point): Point instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_point(self, element, point)
+        self._add_point(self, element, point)
 
-    def add_route(self, element: ET.Element, route: Route) -> ET.Element:
+    def add_route(self, element: ET.Element, route: Route) -> None:
         """
         Add Route instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             route (Route): Route instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_route(self, element, route)
+        self._add_route(self, element, route)
 
-    def add_track_segment(self, element: ET.Element, track_segment: TrackSegment) -> ET.Element:
+    def add_track_segment(self, element: ET.Element, track_segment: TrackSegment) -> None:
         """
         Add TrackSegment instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             track_segment (TrackSegment): TrackSegment instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_track_segment(self, element, track_segment)
+        self._add_track_segment(self, element, track_segment)
 
-    def add_track(self, element: ET.Element, track: Track) -> ET.Element:
+    def add_track(self, element: ET.Element, track: Track) -> None:
         """
         Add Track instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             track (Track): Track instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_track(self, element, track)
+        self._add_track(self, element, track)
 
-    def add_way_point(self, element: ET.Element, way_point: WayPoint) -> ET.Element:
+    def add_way_point(self, element: ET.Element, way_point: WayPoint) -> None:
         """
         Add WayPoint instance element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             way_point (WayPoint): WayPoint instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_way_point(self, element, way_point)
+        self._add_way_point(self, element, way_point)
 
-    def add_track_point(self, element: ET.Element, way_point: WayPoint) -> ET.Element:
+    def add_track_point(self, element: ET.Element, way_point: WayPoint) -> None:
         """
         Add WayPoint instance (with trkpt tag) element to GPX element.
 
         Args:
             element (xml.etree.ElementTree.Element): GPX element.
             way_point (WayPoint): WayPoint instance to add.
-
-        Returns:
-            xml.etree.ElementTree.Element: GPX element.
         """
-        return self._add_track_point(self, element, way_point)
+        self._add_track_point(self, element, way_point)
 
     def _create_schema_loc_str(self, xsi_schema_location: list[str]) -> str:
         """
@@ -320,46 +280,40 @@ class GPXWriter(Writer):
         str
             Schema location string to write in GPX file.
         """
-        schema_location_string = ""
-        for loc in xsi_schema_location:
-            schema_location_string += loc
-            schema_location_string += " "
-        schema_location_string = schema_location_string[:-1]
-        return schema_location_string
+        return " ".join(xsi_schema_location)
 
     def add_root_properties(self) -> None:
         """
         Add properties to the GPX root element.
         """
+        # Name spaces are declared when creating the root element
         self.setIfNotNone(self.gpx_root, "version", self.gpx.version)
         self.setIfNotNone(self.gpx_root, "creator", "ezGPX")
-        for k, v in self.gpx.xmlns.items():
-            self.setIfNotNone(self.gpx_root, "xmlns:" +
-                              k if k != "" else "xmlns", v)
         schema_location_string = self._create_schema_loc_str(
             self.gpx.xsi_schema_location)
-        self.setIfNotNone(self.gpx_root, "xsi:schemaLocation",
+        self.setIfNotNone(self.gpx_root,
+                          XSI_SCHEMA_LOCATION if LXML else "xsi:schemaLocation",
                           schema_location_string)
 
     def add_root_metadata(self) -> None:
         """
         Add metadata element to the GPX root element.
         """
-        self.gpx_root = self.add_metadata(self.gpx_root, self.gpx.metadata)
+        self.add_metadata(self.gpx_root, self.gpx.metadata)
 
     def add_root_way_points(self) -> None:
         """
         Add wpt elements to the GPX root element.
         """
         for way_point in self.gpx.wpt:
-            self.gpx_root = self.add_way_point(self.gpx_root, way_point)
+            self.add_way_point(self.gpx_root, way_point)
 
     def add_root_routes(self) -> None:
         """
         Add rte elements to the GPX root element.
         """
         for route in self.gpx.rte:
-            self.gpx_root = self.add_route(self.gpx_root, route)
+            self.add_route(self.gpx_root, route)
 
     def add_root_tracks(self) -> None:
         """
@@ -368,16 +322,59 @@ class GPXWriter(Writer):
         logging.info("Preparing tracks...")
 
         for track in self.gpx.trk:
-            self.gpx_root = self.add_track(self.gpx_root, track)
+            self.add_track(self.gpx_root, track)
 
     def add_root_extensions(self) -> None:
         """
         Add extensions element to the GPX root element.
         """
         if self.gpx.extensions is not None:
-            self.gpx_root = self.add_extensions(
+            self.add_extensions(
                 self.gpx_root, self.gpx.extensions, self.extensions_fields.get("gpx"))
 
+    def _add_root_elements(self, xf=None) -> Iterator[None]:
+        """
+        Add the sub-elements of the GPX root element (metadata, way points,
+        routes, tracks and extensions), yielding each time a part of the
+        file has been added to the root element (so that it can be written
+        and removed, see write_gpx_incremental).
+
+        Args:
+            xf (lxml.etree.xmlfile, optional): File written by
+                write_gpx_incremental. If provided, tracks are written
+                directly to the file (see _write_track) instead of being
+                added to the root element. Defaults to None.
+        """
+        # Metadata
+        if self.metadata_fields:
+            self.add_root_metadata()
+            yield
+
+        # Way points
+        if self.way_point_fields:
+            self.add_root_way_points()
+            yield
+
+        # Routes
+        if self.route_fields:
+            self.add_root_routes()
+            yield
+
+        # Tracks (one at a time)
+        if self.track_fields:
+            logging.info("Preparing tracks...")
+            for track in self.gpx.trk:
+                if xf is None:
+                    self.add_track(self.gpx_root, track)
+                else:
+                    self._write_track(xf, track)
+                yield
+
+        # Extensions
+        if self.extensions_fields.get("gpx"):
+            self.add_root_extensions()
+            yield
+
     def gpx_to_string(self) -> str:
         """
         Convert Gpx instance to a string (the content of a .gpx file).
@@ -390,31 +387,16 @@ class GPXWriter(Writer):
             self.gpx_string = ""
 
             # Root
-            self.gpx_root = ET.Element("gpx")
+            self.gpx_root = self.create_root(
+                "gpx", self.gpx.xmlns if self.properties else None)
 
             # Properties
             if self.properties:
                 self.add_root_properties()
 
-            # Metadata
-            if self.metadata_fields:
-                self.add_root_metadata()
-
-            # Way points
-            if self.way_point_fields:
-                self.add_root_way_points()
-
-            # Routes
-            if self.route_fields:
-                self.add_root_routes()
-
-            # Tracks
-            if self.track_fields:
-                self.add_root_tracks()
-
-            # Extensions
-            if self.extensions_fields.get("gpx"):
-                self.add_root_extensions()
+            # Metadata, way points, routes, tracks and extensions
+            for _ in self._add_root_elements():
+                pass
 
             # Convert data to string
             logging.info("Converting GPX to string...")
@@ -442,6 +424,101 @@ class GPXWriter(Writer):
             f.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>")
             f.write(self.gpx_string)
 
+    def _write_sub_elements(self, xf, element: ET.Element):
+        """
+        Write the sub-elements of an element (built by the add_* methods) to
+        the file written by write_gpx_incremental and remove them.
+
+        Args:
+            xf (lxml.etree.xmlfile): File to write.
+            element (lxml.etree.Element): Element whose sub-elements are
+                written.
+        """
+        for sub_element in list(element):
+            element.remove(sub_element)
+            # Once removed, a sub-element only declares the name spaces it
+            # uses (eg: in extensions). xf.write would write these
+            # declarations again, xf.element uses the ones of the GPX root
+            # element.
+            if sub_element.nsmap:
+                with xf.element(sub_element.tag, sub_element.attrib):
+                    if sub_element.text is not None:
+                        xf.write(sub_element.text)
+                    self._write_sub_elements(xf, sub_element)
+            else:
+                xf.write(sub_element)
+
+    def _write_track(self, xf, track: Track):
+        """
+        Write a trk element to the file written by write_gpx_incremental,
+        track points being added and written one at a time.
+
+        Args:
+            xf (lxml.etree.xmlfile): File to write.
+            track (Track): Track instance to write.
+        """
+        if ("trkseg" not in self.track_fields
+                or "trkpt" not in self.track_segment_fields):
+            self.add_track(self.gpx_root, track)
+            return
+
+        # Track without its segments (start tag and other sub-elements)
+        header = copy.copy(track)
+        header.trkseg = []
+        self.add_track(self.gpx_root, header)
+        track_ = self.gpx_root[-1]
+        self.gpx_root.remove(track_)
+        with xf.element(track_.tag, track_.attrib):
+            self._write_sub_elements(xf, track_)
+            for track_segment in track.trkseg:
+                # Segment without its track points (start tag and other
+                # sub-elements)
+                header = copy.copy(track_segment)
+                header.trkpt = []
+                self.add_track_segment(self.gpx_root, header)
+                track_segment_ = self.gpx_root[-1]
+                self.gpx_root.remove(track_segment_)
+                with xf.element(track_segment_.tag, track_segment_.attrib):
+                    self._write_sub_elements(xf, track_segment_)
+                    for track_point in track_segment.trkpt:
+                        self.add_track_point(self.gpx_root, track_point)
+                        self._write_sub_elements(xf, self.gpx_root)
+
+    def write_gpx_incremental(self):
+        """
+        Convert Gpx instance to XML and write to file one element at a time
+        (metadata, way points, routes, track points...) with lxml.etree.xmlfile,
+        so that the XML tree and the string of the whole file are never held
+        in memory.
+        """
+        if self.gpx is None:
+            return
+        # Open/create GPX file
+        try:
+            f = open(self.file_path, "wb")
+        except OSError:
+            logging.exception("Could not open/read file: %s",
+                              self.file_path)
+            raise
+        # Write GPX file
+        with f:
+            f.write(b"<?xml version=\"1.0\" encoding=\"UTF-8\"?>")
+
+            # Root
+            self.gpx_root = self.create_root(
+                "gpx", self.gpx.xmlns if self.properties else None)
+
+            # Properties
+            if self.properties:
+                self.add_root_properties()
+
+            # Metadata, way points, routes, tracks and extensions
+            with ET.xmlfile(f, encoding="utf-8") as xf:
+                with xf.element(self.gpx_root.tag, self.gpx_root.attrib,
+                                nsmap=self.gpx_root.nsmap):
+                    for _ in self._add_root_elements(xf):
+                        self._write_sub_elements(xf, self.gpx_root)
+
     def write(
             self,
             file_path: str,
@@ -491,6 +568,10 @@ class GPXWriter(Writer):
 
         # Set parameters
         self.properties = properties
+        self._precision_lat_lon = self.precisions["lat_lon"]
+        self._precision_elevation = self.precisions["elevation"]
+        self._precision_default = self.precisions["default"]
+        self._lat_lon_format_spec = f".{self._precision_lat_lon}f"
         self.bounds_fields = (bounds_fields
                               if bounds_fields is not None
                               else Bounds.fields)
@@ -542,7 +623,7 @@ class GPXWriter(Writer):
             if any(f not in fields for f in mandatory_fields):
                 warnings.warn(f"{element} element must have following fields: {mandatory_fields}"
                             "Missing mandatory fields will automatically be added.")
-                fields = list(set(fields + mandatory_fields))
+                fields = list(set(fields).union(mandatory_fields))
             return fields
        
         self.bounds_fields = check_mandatory_fields("Bounds",
@@ -611,8 +692,12 @@ class GPXWriter(Writer):
             self.track_point_fields)
 
         # Write .gpx file
-        self.gpx_to_string()
-        self.write_gpx()
+        if LXML:
+            self.gpx_string = ""
+            self.write_gpx_incremental()
+        else:
+            self.gpx_to_string()
+            self.write_gpx()
 
         # Check XML schemas
         res = True
@@ -1,9 +1,8 @@
 import os
 from typing import Optional, List, Tuple, Dict
 import logging
-import xml.etree.ElementTree as ET
 
-from .writer import Writer
+from .writer import Writer, ET, SubElement
 from ..gpx_elements import Gpx
 
 DEFAULT_NORMAL_STYLE = {
@@ -23,6 +22,14 @@ DEFAULT_STYLES = [
     ("highlight", DEFAULT_HIGHLIGHT_STYLE)
 ]
 
+# According to .kml file from Google Earth Pro
+KML_NAME_SPACES = {
+    "": "http://www.opengis.net/kml/2.2",
+    "gx": "http://www.google.com/kml/ext/2.2",
+    "kml": "http://www.opengis.net/kml/2.2",
+    "atom": "http://www.w3.org/2005/Atom"
+}
+
 
 class KMLWriter(Writer):
     """
@@ -67,7 +74,7 @@ class KMLWriter(Writer):
         self.gpx_string: str = ""
         self.kml_root = None
 
-    def add_pair(self, element: ET.Element, key: str, style_url: str) -> ET.Element:
+    def add_pair(self, element: ET.Element, key: str, style_url: str) -> None:
         """
         Add StyleMap to KML element.
 
@@ -79,18 +86,12 @@ class KMLWriter(Writer):
             Key.
         style_url : str
             Style URL.
-
-        Returns
-        -------
-        ET.Element
-            KML element.
         """
-        pair_ = ET.SubElement(element, "Pair")
-        pair_, _ = self.add_subelement(pair_, "key", key)
-        pair_, _ = self.add_subelement(pair_, "styleUrl", style_url)
-        return element
+        pair_ = SubElement(element, "Pair")
+        self.add_subelement(pair_, "key", key)
+        self.add_subelement(pair_, "styleUrl", style_url)
 
-    def add_stylemap(self, element: ET.Element, id_: str) -> ET.Element:
+    def add_stylemap(self, element: ET.Element, id_: str) -> None:
         """
         Add StyleMap to KML element.
 
@@ -100,22 +101,16 @@ class KMLWriter(Writer):
             KML element.
         id_ : str
             StyleMap element id.
-
-        Returns
-        -------
-        ET.Element
-            KML element.
         """
-        stylemap_ = ET.SubElement(element, "StyleMap")
+        stylemap_ = SubElement(element, "StyleMap")
         self.setIfNotNone(stylemap_, "id", id_)
         style_id = 1
         for style_key, _ in self.styles:  # _ used to be called style
-            stylemap_ = self.add_pair(
+            self.add_pair(
                 stylemap_, style_key, "#style" + str(style_id))
             style_id += 1
-        return element
 
-    def add_polystyle(self, element: ET.Element, style: Dict) -> ET.Element:
+    def add_polystyle(self, element: ET.Element, style: Dict) -> None:
         """
         Add PolyStyle to KML element.
 
@@ -125,22 +120,16 @@ class KMLWriter(Writer):
             KML element.
         style : Dict
             Style.
-
-        Returns
-        -------
-        ET.Element
-            KML element.
         """
-        polystyle_ = ET.SubElement(element, "PolyStyle")
+        polystyle_ = SubElement(element, "PolyStyle")
         try:
-            polystyle_, _ = self.add_subelement_number(
+            self.add_subelement_number(
                 polystyle_, "fill", style["fill"])
         except:
             logging.warning("No fill attribute in style")
-            polystyle_, _ = self.add_subelement_number(polystyle_, "fill", 0)
-        return element
+            self.add_subelement_number(polystyle_, "fill", 0)
 
-    def add_linestyle(self, element: ET.Element, style: Dict) -> ET.Element:
+    def add_linestyle(self, element: ET.Element, style: Dict) -> None:
         """
         Add LineStyle to KML element.
 
@@ -150,29 +139,23 @@ class KMLWriter(Writer):
             KML element.
         style : Dict
             Style.
-
-        Returns
-        -------
-        ET.Element
-            KML element.
         """
-        linestyle_ = ET.SubElement(element, "LineStyle")
+        linestyle_ = SubElement(element, "LineStyle")
         try:
-            linestyle_, _ = self.add_subelement(
+            self.add_subelement(
                 linestyle_, "color", style["color"])
         except:
             logging.warning("No color attribute in style")
-            linestyle_, _ = self.add_subelement(
+            self.add_subelement(
                 linestyle_, "color", "ff0000ff")
         try:
-            linestyle_, _ = self.add_subelement_number(
+            self.add_subelement_number(
                 linestyle_, "width", style["width"])
         except:
             logging.warning("No width attribute in style")
-            linestyle_, _ = self.add_subelement_number(linestyle_, "width", 2)
-        return element
+            self.add_subelement_number(linestyle_, "width", 2)
 
-    def add_style(self, element: ET.Element, id_: str, style: Dict) -> ET.Element:
+    def add_style(self, element: ET.Element, id_: str, style: Dict) -> None:
         """
         Add Style to KML element.
 
@@ -184,19 +167,13 @@ class KMLWriter(Writer):
             Style element id.
         style : Dict
             Line style.
-
-        Returns
-        -------
-        ET.Element
-            KML element.
         """
-        style_ = ET.SubElement(element, "Style")
+        style_ = SubElement(element, "Style")
         self.setIfNotNone(style_, "id", id_)
-        style_ = self.add_linestyle(style_, style)
-        style_ = self.add_polystyle(style_, style)
-        return element
+        self.add_linestyle(style_, style)
+        self.add_polystyle(style_, style)
 
-    def add_linestring(self, element: ET.Element) -> ET.Element:
+    def add_linestring(self, element: ET.Element) -> None:
         """
         Add LineString to KML element.
 
@@ -204,14 +181,9 @@ class KMLWriter(Writer):
         ----------
         element : ET.Element
             KML element.
-
-        Returns
-        -------
-        ET.Element
-            KML element.
         """
-        linestring_ = ET.SubElement(element, "LineString")
-        linestring_, _ = self.add_subelement_number(
+        linestring_ = SubElement(element, "LineString")
+        self.add_subelement_number(
             linestring_, "tessellate", 1)
         if self.ele:
             coordinates = self.gpx.to_csv(
@@ -219,11 +191,10 @@ class KMLWriter(Writer):
         else:
             coordinates = self.gpx.to_csv(
                 path=None, values=["lon", "lat"], header=False).replace("\n", " ")
-        linestring_, _ = self.add_subelement(
+        self.add_subelement(
             linestring_, "coordinates", coordinates)
-        return element
 
-    def add_placemark(self, element: ET.Element) -> ET.Element:
+    def add_placemark(self, element: ET.Element) -> None:
         """
         Add Placemark to KML element.
 
@@ -231,21 +202,15 @@ class KMLWriter(Writer):
         ----------
         element : ET.Element
             KML element.
-
-        Returns
-        -------
-        ET.Element
-            KML element.
         """
-        placemark_ = ET.SubElement(element, "Placemark")
-        placemark_, _ = self.add_subelement(
+        placemark_ = SubElement(element, "Placemark")
+        self.add_subelement(
             placemark_, "name", self.gpx.name())
-        placemark_, _ = self.add_subelement(
+        self.add_subelement(
             placemark_, "styleUrl", "#stylemap")
-        placemark_ = self.add_linestring(placemark_)
-        return element
+        self.add_linestring(placemark_)
 
-    def add_document(self, element: ET.Element) -> ET.Element:
+    def add_document(self, element: ET.Element) -> None:
         """
         Add Document to KML element.
 
@@ -253,21 +218,15 @@ class KMLWriter(Writer):
         ----------
         element : ET.Element
             KML element.
-
-        Returns
-        -------
-        ET.Element
-            KML element.
         """
-        document_ = ET.SubElement(element, "Document")
-        document_, _ = self.add_subelement(document_, "name", self.file_name)
+        document_ = SubElement(element, "Document")
+        self.add_subelement(document_, "name", self.file_name)
         id_ = 1
         for _, style in self.styles:  # _ used to be called style_key
-            document_ = self.add_style(document_, "style" + str(id), style)
+            self.add_style(document_, "style" + str(id), style)
             id_ += 1
-        document_ = self.add_stylemap(document_, "stylemap")
-        document_ = self.add_placemark(document_)
-        return element
+        self.add_stylemap(document_, "stylemap")
+        self.add_placemark(document_)
 
     def add_root_document(self) -> None:
         """
@@ -275,19 +234,7 @@ class KMLWriter(Writer):
         """
         logging.info("Preparing Document...")
 
-        self.kml_root = self.add_document(self.kml_root)
-
-    def add_root_properties(self) -> None:
-        """
-        Add properties to the GPX root element.
-        """
-        logging.info("Preparing properties...")
-
-        # According to .kml file from Google Earth Pro
-        self.kml_root.set("xmlns", "http://www.opengis.net/kml/2.2")
-        self.kml_root.set("xmlns:gx", "http://www.google.com/kml/ext/2.2")
-        self.kml_root.set("xmlns:kml", "http://www.opengis.net/kml/2.2")
-        self.kml_root.set("xmlns:atom", "http://www.w3.org/2005/Atom")
+        self.add_document(self.kml_root)
 
     def gpx_to_string(self) -> str:
         """
@@ -301,12 +248,9 @@ class KMLWriter(Writer):
             # Reset string
             self.kml_string = ""
 
-            # Root
-            self.kml_root = ET.Element("kml")
-
-            # Properties
-            if self.properties:
-                self.add_root_properties()
+            # Root (and properties)
+            self.kml_root = self.create_root(
+                "kml", KML_NAME_SPACES if self.properties else None)
 
             # Document
             self.add_root_document()
@@ -1,10 +1,16 @@
-from typing import Union, Tuple
+from typing import Dict, Optional, Union
 import logging
-import xml.etree.ElementTree as ET
 from datetime import datetime
 
 from ..gpx_elements import Gpx
 from ..parsers import DEFAULT_PRECISION, DEFAULT_TIME_FORMAT
+# Same XML backend as the parsers: lxml when available (C tree builder and
+# serializer), unless EZGPX_FORCE_STDLIB_ET=1
+from ..parsers.xml_parser import ET
+
+LXML = ET.__name__ == "lxml.etree"
+# Bound once (called for every element written)
+SubElement = ET.SubElement
 
 
 class Writer():
@@ -26,6 +32,37 @@ class Writer():
         self.gpx: Gpx = gpx
         self.file_path: str = None
 
+    def create_root(
+            self, tag: str,
+            name_spaces: Optional[Dict[str, str]] = None) -> ET.Element:
+        """
+        Create the root element of the file, declaring name spaces.
+
+        Parameters
+        ----------
+        tag : str
+            Root element tag.
+        name_spaces : Optional[Dict[str, str]], optional
+            Name spaces indexed by prefix ("" for the default name space),
+            by default None
+
+        Returns
+        -------
+        ET.Element
+            Root element.
+        """
+        if not name_spaces:
+            return ET.Element(tag)
+        # lxml does not allow xmlns attributes: name spaces must be declared
+        # when creating the element
+        if LXML:
+            return ET.Element(tag, nsmap={k if k != "" else None: v
+                                          for k, v in name_spaces.items()})
+        root = ET.Element(tag)
+        for k, v in name_spaces.items():
+            self.setIfNotNone(root, "xmlns:" + k if k != "" else "xmlns", v)
+        return root
+
     def setIfNotNone(self, element: ET.Element, field: str, value):
         """
         _summary_
@@ -44,7 +81,7 @@ class Writer():
 
     def add_subelement(
             self, element: ET.Element, sub_element: str,
-            text: str) -> Tuple[ET.Element, Union[ET.Element, None]]:
+            text: str) -> Optional[ET.Element]:
         """
         Add sub-element to GPX element.
 
@@ -54,18 +91,18 @@ class Writer():
             text (str): GPX sub-element text.
 
         Returns:
-            Tuple[xml.etree.ElementTree.Element, Union[xml.etree.ElementTree.Element, None]]: GPX element and GPX sub-element (if not None).
+            Optional[xml.etree.ElementTree.Element]: GPX sub-element (if text is not None).
         """
         sub_element_ = None
         if text is not None:
-            sub_element_ = ET.SubElement(element, sub_element)
+            sub_element_ = SubElement(element, sub_element)
             sub_element_.text = text
-        return element, sub_element_
+        return sub_element_
 
     def add_subelement_number(
             self, element: ET.Element, sub_element: str,
             number: Union[int, float],
-            precision: int = DEFAULT_PRECISION) -> Tuple[ET.Element, Union[ET.Element, None]]:
+            precision: int = DEFAULT_PRECISION) -> Optional[ET.Element]:
         """
         Add sub-element to GPX element.
 
@@ -76,22 +113,24 @@ class Writer():
             precision (int, optional): Precision. Defaults to DEFAULT_PRECISION.
 
         Returns:
-            Tuple[xml.etree.ElementTree.Element, Union[xml.etree.ElementTree.Element, None]]: GPX element and GPX sub-element (if not None).
+            Optional[xml.etree.ElementTree.Element]: GPX sub-element (if number is not None).
         """
         sub_element_ = None
         if number is not None:
-            sub_element_ = ET.SubElement(element, sub_element)
+            sub_element_ = SubElement(element, sub_element)
             if isinstance(number, int):
                 sub_element_.text = str(number)
             elif isinstance(number, float):
-                sub_element_.text = f"{number:.{precision}f}"
+                # Precision given as argument without building a format
+                # spec for each number
+                sub_element_.text = "%.*f" % (precision, number)
             else:
                 logging.error("Invalid number type.")
-        return element, sub_element_
+        return sub_element_
 
     def add_subelement_time(
             self, element: ET.Element, sub_element: str, time: datetime,
-            format_: str = DEFAULT_TIME_FORMAT) -> ET.Element:
+            format_: str = DEFAULT_TIME_FORMAT) -> Optional[ET.Element]:
         """
         Add sub-element to GPX element.
 
@@ -102,16 +141,16 @@ class Writer():
             format (str, optional): Format. Defaults to DEFAULT_TIME_FORMAT.
 
         Returns:
-            Tuple[xml.etree.ElementTree.Element, Union[xml.etree.ElementTree.Element, None]]: GPX element and GPX sub-element (if not None).
+            Optional[xml.etree.ElementTree.Element]: GPX sub-element (if time is not None).
         """
         sub_element_ = None
         if time is not None:
-            sub_element_ = ET.SubElement(element, sub_element)
+            sub_element_ = SubElement(element, sub_element)
             try:
                 sub_element_.text = time.strftime(format_)
-            except:
+            except (AttributeError, TypeError, ValueError):
                 logging.error("Invalid time format.")
-        return element, sub_element_
+        return sub_element_
 
     def check_xml_schemas(
             self,
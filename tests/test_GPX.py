@@ -1,5 +1,7 @@
 import sys
 import os
+import subprocess
+import xml.etree.ElementTree as ET
 import pytest
 import filecmp
 from shutil import rmtree
@@ -14,7 +16,9 @@ parent_folder = os.path.realpath(os.path.dirname(file_folder)) # ie: ezGPX
 os.chdir(file_folder)
 sys.path.append(parent_folder + "/ezgpx")
 
-from ezgpx import GPX
+from ezgpx import GPX, GPXParser, KMLParser
+from ezgpx.parsers import _expat_points
+from ezgpx.utils import _stats_numba
 
 FILES_DIRECTORY = "test_files/files/"
 REFERENCE_FILES_DIRECTORY = "test_files/reference_files/"
@@ -35,6 +39,97 @@ class TestGPX():
         gpx = GPX(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"), xml_schema=True, xml_extensions_schemas=False)
         invalid_gpx = GPX(os.path.join(FILES_DIRECTORY, "invalid_schema.gpx"), xml_schema=False, xml_extensions_schemas=False)
 
+    @pytest.mark.parametrize("expat", [True, False])
+    @pytest.mark.parametrize("file_name", ["strava_run_1.gpx", "invalid_schema.gpx"])
+    def test_parse_stats_only(self, monkeypatch, expat, file_name):
+        # Select track points reader (expat callbacks or streaming)
+        monkeypatch.setattr(_expat_points, "EXPAT_AVAILABLE", expat)
+        # Parse GPX Files (track nested in metadata in invalid_schema.gpx)
+        gpx = GPX(os.path.join(FILES_DIRECTORY, file_name), xml_schema=False, xml_extensions_schemas=False)
+        stats = GPXParser(os.path.join(FILES_DIRECTORY, file_name), xml_schemas=False, stats_only=True).stats
+        # Tests
+        assert(stats["nb_points"] == gpx.nb_points())
+        assert(stats["bounds"] == gpx.bounds())
+        assert(stats["distance"] == pytest.approx(gpx.distance()))
+        assert(stats["ascent"] == pytest.approx(gpx.ascent()))
+        assert(stats["descent"] == pytest.approx(gpx.descent()))
+        assert(stats["min_elevation"] == gpx.min_elevation())
+        assert(stats["max_elevation"] == gpx.max_elevation())
+        assert(stats["utc_start_time"] == gpx.gpx.utc_start_time())
+        assert(stats["utc_stop_time"] == gpx.gpx.utc_stop_time())
+
+    @pytest.mark.parametrize("expat", [True, False])
+    def test_parse_stats_only_empty_elevation(self, monkeypatch, expat):
+        # Select track points reader (expat callbacks or streaming)
+        monkeypatch.setattr(_expat_points, "EXPAT_AVAILABLE", expat)
+        # Parse GPX Files (empty ele element in second track point)
+        gpx = GPX(os.path.join(FILES_DIRECTORY, "empty_elevation.gpx"), xml_schema=False, xml_extensions_schemas=False)
+        stats = GPXParser(os.path.join(FILES_DIRECTORY, "empty_elevation.gpx"), xml_schemas=False, stats_only=True).stats
+        # Tests
+        assert(stats["nb_points"] == gpx.nb_points())
+        assert(stats["distance"] == pytest.approx(gpx.distance()))
+        assert(stats["ascent"] == pytest.approx(0.8))
+        assert(stats["descent"] == 0.0)
+        assert(stats["min_elevation"] == 110.7)
+        assert(stats["max_elevation"] == 111.5)
+        assert(stats["utc_start_time"] == gpx.gpx.utc_start_time())
+        assert(stats["utc_stop_time"] == gpx.gpx.utc_stop_time())
+
+    @pytest.mark.parametrize("file_name", ["strava_run_1.gpx", "invalid_schema.gpx"])
+    def test_stats_kernels(self, monkeypatch, file_name):
+        # Parse GPX Files
+        gpx = GPX(os.path.join(FILES_DIRECTORY, file_name), xml_schema=False, xml_extensions_schemas=False)
+        # Compute statistics with and without kernels (compiled if numba is
+        # installed)
+        results = []
+        for numba_available in [True, False]:
+            monkeypatch.setattr(_stats_numba, "NUMBA_AVAILABLE", numba_available)
+            stats = GPXParser(os.path.join(FILES_DIRECTORY, file_name), xml_schemas=False, stats_only=True).stats
+            results.append((gpx.bounds(), gpx.ascent(), gpx.descent(),
+                            gpx.min_elevation(), gpx.max_elevation(), stats))
+        # Tests
+        (bounds, ascent, descent, min_elevation, max_elevation, stats), ref = results
+        assert(bounds == ref[0])
+        assert(ascent == pytest.approx(ref[1]))
+        assert(descent == pytest.approx(ref[2]))
+        assert(min_elevation == ref[3])
+        assert(max_elevation == ref[4])
+        for key in ["bounds", "min_elevation", "max_elevation"]:
+            assert(stats[key] == ref[5][key])
+        for key in ["ascent", "descent"]:
+            assert(stats[key] == pytest.approx(ref[5][key]))
+
+    def test_parse_without_extensions(self):
+        # Parse GPX Files
+        gpx = GPX(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"))
+        gpx_no_ext = GPXParser(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"), extensions=False).gpx
+        trkpt = gpx.gpx.trk[0].trkseg[0].trkpt
+        trkpt_no_ext = gpx_no_ext.trk[0].trkseg[0].trkpt
+        # Tests
+        assert(trkpt[0].extensions is not None)
+        assert(all(track_point.extensions is None for track_point in trkpt_no_ext))
+        assert([(p.lat, p.lon, p.ele, p.time) for p in trkpt_no_ext]
+               == [(p.lat, p.lon, p.ele, p.time) for p in trkpt])
+
+    def test_parse_kml_coordinates(self, tmp_path):
+        # Parse KML files
+        with open(os.path.join(FILES_DIRECTORY, "river_run.kml"), encoding="utf-8") as file:
+            kml = file.read()
+        gpx = KMLParser(os.path.join(FILES_DIRECTORY, "river_run.kml"), check_xml_schemas=False).gpx
+        trkpt = gpx.trk[0].trkseg[0].trkpt
+        # Tests
+        assert(len(trkpt) == kml.count(",0 "))
+        assert((trkpt[0].lat, trkpt[0].lon, trkpt[0].ele) == (43.95650026952033, 4.481370525731916, 0.0))
+        # Mixed "lon,lat" and "lon,lat,ele" tuples (second to fourth points
+        # without elevation)
+        first_ele = kml.index(",0 ") + 3
+        invalid_kml = kml[:first_ele] + kml[first_ele:].replace(",0 ", " ", 3)
+        invalid_kml_path = str(tmp_path / "river_run_2d.kml")
+        with open(invalid_kml_path, "w", encoding="utf-8") as file:
+            file.write(invalid_kml)
+        with pytest.raises(IndexError):
+            KMLParser(invalid_kml_path, check_xml_schemas=False)
+
     #==== Check Schemas ======================================================#check_xml_schemas
 
     def test_check_schemas(self):
@@ -73,6 +168,47 @@ class TestGPX():
         # Test
         assert(gpx.nb_points() == 939)
 
+    def test_segment_arrays(self):
+        # Parse GPX Files
+        gpx = GPX(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"))
+        trkseg = gpx.gpx.trk[0].trkseg[0]
+        # Test
+        assert(trkseg.lat_array.shape == (len(trkseg.trkpt),))
+        assert(trkseg.lat_array[0] == trkseg.trkpt[0].lat)
+        assert(trkseg.lon_array[-1] == trkseg.trkpt[-1].lon)
+        assert(trkseg.ele_array[0] == trkseg.trkpt[0].ele)
+        assert(trkseg.time_array[0] == np.datetime64(trkseg.trkpt[0].time))
+
+    def test_columnar_segments(self):
+        # Parse GPX Files
+        gpx = GPX(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"))
+        columnar_gpx = GPXParser(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"), columnar=True).gpx
+        trkseg = gpx.gpx.trk[0].trkseg[0]
+        columnar_trkseg = columnar_gpx.trk[0].trkseg[0]
+        # Test
+        assert(np.array_equal(columnar_trkseg.lat_array, trkseg.lat_array))
+        assert(np.array_equal(columnar_trkseg.time_array, trkseg.time_array))
+        assert(columnar_gpx.distance() == gpx.gpx.distance())
+        assert(columnar_trkseg.trkpt[-1].time == trkseg.trkpt[-1].time)
+
+    def test_simplify(self):
+        # Parse GPX Files
+        gpx = GPX(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"))
+        simplified_gpx = GPX(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"), simplify_tolerance=2)
+        trkseg = gpx.gpx.trk[0].trkseg[0]
+        simplified_trkseg = simplified_gpx.gpx.trk[0].trkseg[0]
+        # Tests
+        assert(simplified_gpx.nb_points() < gpx.nb_points())
+        assert((simplified_trkseg.trkpt[0].lat, simplified_trkseg.trkpt[0].lon)
+               == (trkseg.trkpt[0].lat, trkseg.trkpt[0].lon))
+        assert((simplified_trkseg.trkpt[-1].lat, simplified_trkseg.trkpt[-1].lon)
+               == (trkseg.trkpt[-1].lat, trkseg.trkpt[-1].lon))
+        nb_points = len(trkseg.trkpt)
+        first_point, last_point = trkseg.trkpt[0], trkseg.trkpt[-1]
+        trkseg.simplify(10)
+        assert(len(trkseg.trkpt) < len(simplified_trkseg.trkpt) < nb_points)
+        assert(trkseg.trkpt[0] is first_point and trkseg.trkpt[-1] is last_point)
+
     @pytest.mark.skip(reason="nothing to test")
     def test_first_point(self):
         pass
@@ -250,6 +386,24 @@ class TestGPX():
         # Test
         assert(filecmp.cmp("tmp/strava_run_1_test.gpx", os.path.join(REFERENCE_FILES_DIRECTORY, "strava_run_1.gpx"), False))
         
+    @pytest.mark.parametrize("file_name", ["strava_run_1.gpx", "square_1.gpx", "alltrails_1.gpx", "Black_Forest_01_Baden.gpx"])
+    def test_to_gpx_stdlib_et(self, tmp_path, file_name):
+        # Write GPX files with lxml (incremental writing) and with
+        # xml.etree.ElementTree (EZGPX_FORCE_STDLIB_ET=1)
+        script = "import sys; from ezgpx import GPX; GPX(sys.argv[1]).to_gpx(sys.argv[2], xml_schema=False)"
+        paths = {}
+        for force_stdlib_et in ["0", "1"]:
+            paths[force_stdlib_et] = str(tmp_path / f"{force_stdlib_et}_{file_name}")
+            env = dict(os.environ, EZGPX_FORCE_STDLIB_ET=force_stdlib_et,
+                       PYTHONPATH=os.pathsep.join([parent_folder, os.environ.get("PYTHONPATH", "")]))
+            subprocess.run([sys.executable, "-c", script, os.path.join(FILES_DIRECTORY, file_name), paths[force_stdlib_et]],
+                           env=env, check=True)
+        # Parse written files (namespace prefixes may differ)
+        elements = {force_stdlib_et: [(e.tag, e.attrib, e.text, e.tail) for e in ET.parse(path).iter()]
+                    for force_stdlib_et, path in paths.items()}
+        # Test
+        assert(elements["0"] == elements["1"])
+
     def test_to_kml(self):
         # Parse GPX Files
         gpx = GPX(os.path.join(FILES_DIRECTORY, "strava_run_1.gpx"))
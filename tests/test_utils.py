@@ -22,6 +22,24 @@ class TestUtils():
         point_2 = WayPoint("wpt", 43.0, 5.0)
         assert math.isclose(utils.haversine_distance(point_1, point_2), 603020.0, abs_tol=1000.0)
 
+    def test_haversine_distance_array(self):
+        point_1 = WayPoint("wpt", 48.0, 2.0)
+        point_2 = WayPoint("wpt", 43.0, 5.0)
+        d = utils.haversine_distance_array(np.array([point_1.lat, point_2.lat]),
+                                           np.array([point_1.lon, point_2.lon]),
+                                           np.array([point_2.lat, point_2.lat]),
+                                           np.array([point_2.lon, point_2.lon]))
+        assert math.isclose(d[0], utils.haversine_distance(point_1, point_2))
+        assert math.isclose(d[1], 0.0, abs_tol=1e-6)
+
+    def test_equirectangular_projection(self):
+        point_1 = WayPoint("wpt", 44.0433320, 4.4530890)
+        point_2 = WayPoint("wpt", 44.0440000, 4.4540000)
+        x, y = utils.equirectangular_projection(np.array([point_1.lat, point_2.lat]),
+                                                np.array([point_1.lon, point_2.lon]))
+        assert math.isclose(math.hypot(x[1] - x[0], y[1] - y[0]),
+                            utils.haversine_distance(point_1, point_2), rel_tol=1e-3)
+
     def _test_perpendicular_distance_horizontal_line(self):
         start = WayPoint("wpt", 0, 0)
         end = WayPoint("wpt", 0, 2)